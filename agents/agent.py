@@ -98,6 +98,27 @@ class Agent:
         self.archetype = capsule_data.get(
             "archetype", "default")  # Agent archetype
 
+    def snapshot_view(self) -> Dict[str, Any]:
+        """
+        Build the snapshot served by SnapshotPanel.get_agent_snapshot in one call.
+        Built on request from current values, so identity changes and in-place tag edits are always reflected.
+
+        :return: New snapshot dictionary.
+        """
+        identity = self.agent_identity
+        tags = self.tags
+        return {
+            "public_snippet": self.public_snippet,
+            "top_badge": tags[0] if tags else None,
+            "current_mood": "neutral",  # Placeholder
+            "shared_attributes": {
+                "goal": self.goal,
+                "values": self.values,
+                "wallet_address": identity.wallet_address if identity else None,
+                "nft_assigned": identity.nft_assigned if identity else False,
+            },
+        }
+
     def get_agent_id(self) -> Optional[str]:
         """
         Get the unique agent ID if available.
@@ -100,6 +100,14 @@ class BadgeXPSystem:
                 return True
         return False
 
+    def reset(self) -> None:
+        """
+        Clear all tracked XP and badges in place.
+        Badge capsules already stored in the CapsuleRegistry are left untouched.
+        """
+        self.agent_xp.clear()
+        self.agent_badges.clear()
+
 
 def grant_xp(agent_id: str, amount: int, reason: str = ""):
     """
@@ -1,5 +1,4 @@
 import threading
-import time
 from typing import Optional, Dict, Any, List
 from registry.capsule_registry import CapsuleRegistry, Capsule
 from memory.agent_memory import AgentMemory
@@ -48,7 +47,8 @@ class GoalReevaluationModule:
     def _periodic_reevaluation_loop(self):
         while not self._stop_event.is_set():
             self.reevaluate_all_agents()
-            time.sleep(self.reevaluation_interval)
+            # Wait on the stop event so stop_periodic_reevaluation returns promptly
+            self._stop_event.wait(self.reevaluation_interval)
 
     def reevaluate_all_agents(self):
         """
@@ -127,9 +127,13 @@ class CodeSandboxRunner:
             logger.error(
                 f"Exception during sandbox execution: {traceback.format_exc()}")
 
-    def execute_sandbox(self, timeout_seconds: int = 5):
+    def execute_sandbox(self, timeout_seconds: float = 5):
         """
         Execute the submitted code in a sandbox with timeout and safety checks.
+        Sub-second timeouts are supported. On timeout the call returns promptly but the
+        submitted code is not stopped: its daemon worker thread is abandoned and keeps
+        running until it finishes or the process exits, though it never keeps the
+        interpreter alive.
         Returns the sandbox result or raises an exception if failed.
         """
         if not EXPERIMENTAL_FEATURES.get("chaos_pack", False):
@@ -141,12 +145,13 @@ class CodeSandboxRunner:
             logger.error("Code safety validation failed; aborting execution.")
             raise RuntimeError("Code safety validation failed.")
 
-        self._execution_thread = threading.Thread(target=self._execute_code)
+        self._execution_thread = threading.Thread(
+            target=self._execute_code, daemon=True)
         self._execution_thread.start()
         self._execution_thread.join(timeout=timeout_seconds)
 
         if self._execution_thread.is_alive():
-            logger.error("Code execution timed out; terminating.")
+            logger.error("Code execution timed out; abandoning the worker thread.")
             raise TimeoutError("Code execution timed out.")
 
         if self._execution_exception:
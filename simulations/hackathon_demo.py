@@ -327,6 +327,9 @@ class DemoScenarioOrchestrator:
         for k, v in summary.items():
             logger.info(f"  {k}: {v}")
 
+        # Expose the in-memory log so callers need not re-read the saved file
+        summary["session_log"] = self.session_log
+
         return summary
 
 
@@ -344,6 +347,8 @@ def main():
 
     print("\nDemo Summary:")
     for key, value in summary.items():
+        if key == "session_log":
+            continue
         print(f"{key}: {value}")
 
 
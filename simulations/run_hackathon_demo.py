@@ -16,6 +16,8 @@ def main():
 
     print("\nDemo Summary:")
     for key, value in summary.items():
+        if key == "session_log":
+            continue
         print(f"{key}: {value}")
 
 
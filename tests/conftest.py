@@ -0,0 +1,98 @@
+import logging
+import os
+from unittest.mock import patch, MagicMock
+
+import pytest
+
+# Behavioral tests don't exercise JIT-compiled numerics, so skip Numba
+# compilation unless FULL_JIT=1 asks for it (e.g. a nightly job validating
+# the kernels). This must run before any project module is imported.
+if os.environ.get("FULL_JIT") != "1":
+    os.environ.setdefault("NUMBA_DISABLE_JIT", "1")
+
+# Keep visibility preference updates from writing visibility_preferences.log
+# into the working directory.
+os.environ.setdefault("VISPREF_LOG", "0")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _quiet_logs():
+    """
+    Silence logging for the whole session.
+    Tests that inspect log output use ``caplog.set_level``, which re-enables
+    the requested level for the duration of the test.
+    """
+    logging.disable(logging.CRITICAL)
+    yield
+    logging.disable(logging.NOTSET)
+
+
+@pytest.fixture(scope="session")
+def mock_pinecone():
+    """
+    Patch the Pinecone environment and client once for the whole session.
+
+    Yields the mocked Pinecone client instance returned by ``Pinecone(...)``.
+    """
+    with patch.dict(os.environ, {
+        "PINECONE_API_KEY": "fake_key",
+        "PINECONE_ENVIRONMENT": "fake_env"
+    }), patch("memory.agent_memory.Pinecone") as mock_pinecone_class:
+        mock_pc_instance = MagicMock()
+        mock_pc_instance.list_indexes.return_value = []
+        mock_pc_instance.Index.return_value = MagicMock()
+        mock_pinecone_class.return_value = mock_pc_instance
+        yield mock_pc_instance
+
+
+@pytest.fixture
+def chaos_flag_factory():
+    """
+    Build setters for the "chaos_pack" entry of an EXPERIMENTAL_FEATURES dict.
+    ``chaos_flag_factory(flags)`` returns ``set_flag(value)``; every touched
+    dict gets its original value back after the test.
+    """
+    originals = []
+
+    def factory(flags):
+        originals.append((flags, flags.get("chaos_pack")))
+        return lambda value: flags.__setitem__("chaos_pack", value)
+
+    yield factory
+    for flags, original in reversed(originals):
+        flags["chaos_pack"] = original
+
+
+class DummyWalletManager:
+    """
+    Wallet manager double with a fixed address and signature.
+    """
+
+    def __init__(self):
+        self.get_wallet_address = MagicMock(return_value="0xWalletAddress")
+        self.sign_typed_data = MagicMock(return_value="0xSignature")
+
+
+@pytest.fixture
+def wallet_manager():
+    return DummyWalletManager()
+
+
+@pytest.fixture
+def payment_handler(wallet_manager):
+    from agents.x402_payment_handler import X402PaymentHandler
+    return X402PaymentHandler(wallet_manager)
+
+
+@pytest.fixture(scope="module")
+def payment_params():
+    """
+    Canonical EIP-712 payment parameters shared by the x402 tests.
+    Built once per module; tests must not mutate it, copy it for variants instead.
+    """
+    return {
+        "domain": {"name": "Test"},
+        "types": {"TestType": []},
+        "primaryType": "TestType",
+        "message": {"foo": "bar"},
+    }
@@ -0,0 +1,24 @@
+from types import SimpleNamespace
+
+from ui.badge_visualization import BadgeVisualization
+
+
+def _badge(name=None):
+    return SimpleNamespace(values={"badge_name": name} if name else {})
+
+
+def test_render_badges():
+    assert BadgeVisualization.render_badges([]) == "No badges earned yet."
+    rendered = BadgeVisualization.render_badges([_badge("Trader"), _badge()])
+    assert rendered == "Badges: Trader, Unnamed Badge"
+
+
+def test_render_badges_reuses_cached_string():
+    first = BadgeVisualization.render_badges([_badge("Pioneer"), _badge("Broker")])
+    second = BadgeVisualization.render_badges([_badge("Pioneer"), _badge("Broker")])
+    assert first is second
+
+
+def test_render_xp():
+    assert BadgeVisualization.render_xp(250) == "Total XP: 250"
+    assert BadgeVisualization.render_xp(250) is BadgeVisualization.render_xp(250)
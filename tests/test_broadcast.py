@@ -1,17 +1,21 @@
 import unittest
+from unittest.mock import Mock
+import pytest
 from agents.agent import Agent, AgentIdentity
 from visibility.visibility_preferences import VisibilityPreferences
 
 
-class MockVisibilityPreferences:
-    def __init__(self, can_view_result=True):
-        self.allow_broadcast = can_view_result
-
-    def can_view(self, category):
-        return self.allow_broadcast
+def _prefs(view=True):
+    prefs = Mock(spec=VisibilityPreferences)
+    prefs.can_view.return_value = view
+    return prefs
 
 
 class TestAgentBroadcast(unittest.TestCase):
+    @pytest.fixture(autouse=True)
+    def _capture(self, capsys):
+        self._capsys = capsys
+
     def setUp(self):
         capsule_data = {
             "capsule_id": "capsule123",
@@ -27,56 +31,26 @@ class TestAgentBroadcast(unittest.TestCase):
         self.agent = Agent(capsule_data, agent_identity)
 
     def test_broadcast_success(self):
-        visibility_prefs = MockVisibilityPreferences(can_view_result=True)
+        visibility_prefs = _prefs(view=True)
         message = "This is a test broadcast."
         result = self.agent.broadcast_to_public(message, visibility_prefs)
         self.assertTrue(result)
 
     def test_broadcast_failure_due_to_visibility(self):
-        visibility_prefs = MockVisibilityPreferences(can_view_result=False)
+        visibility_prefs = _prefs(view=False)
         message = "This broadcast should fail."
         result = self.agent.broadcast_to_public(message, visibility_prefs)
         self.assertFalse(result)
 
     def test_broadcast_message_content(self):
-        visibility_prefs = MockVisibilityPreferences(can_view_result=True)
+        visibility_prefs = _prefs(view=True)
         message = "Check message content."
-        # Capture printed output
-        import io
-        import sys
-        captured_output = io.StringIO()
-        sys.stdout = captured_output
         self.agent.broadcast_to_public(message, visibility_prefs)
-        sys.stdout = sys.__stdout__
-        output = captured_output.getvalue()
+        output = self._capsys.readouterr().out
         self.assertIn("agent123", output)
         self.assertIn("Public Persona", output)
         self.assertIn(message, output)
 
 
-class AgentKit:
-    def __init__(self, config):
-        self.wallets = self.WalletManager()
-
-    class WalletManager:
-        def create(self, network):
-            return "0x1234567890abcdef"
-
-
-class AgentKitConfig:
-    def __init__(self, wallet_provider):
-        self.wallet_provider = wallet_provider
-
-
-class CdpEvmServerWalletProvider:
-    def __init__(self, config):
-        self.config = config
-
-
-class CdpEvmServerWalletProviderConfig:
-    def __init__(self, network):
-        self.network = network
-
-
 if __name__ == "__main__":
     unittest.main()
@@ -1,84 +1,96 @@
-import unittest
+import threading
+import time
 from unittest.mock import patch, MagicMock
+
+import pytest
 from chaos_pack.foreign_code_sandbox import CodeSandboxRunner, EXPERIMENTAL_FEATURES
-import logging
-
-
-class TestCodeSandboxRunner(unittest.TestCase):
-    def setUp(self):
-        # Ensure feature flag is enabled for tests
-        EXPERIMENTAL_FEATURES["chaos_pack"] = True
-        # Suppress logging during tests
-        logging.disable(logging.CRITICAL)
-
-    def tearDown(self):
-        # Re-enable logging after tests
-        logging.disable(logging.NOTSET)
-
-    def test_compute_budget_calculation(self):
-        runner = CodeSandboxRunner("print('test')", compute_budget=50)
-        self.assertEqual(runner.compute_budget, 50)
-
-    def test_execute_sandbox_simple_code(self):
-        code = "result = 2 + 3"
-        runner = CodeSandboxRunner(code, compute_budget=100)
-        result = runner.execute_sandbox(timeout_seconds=5)
-        self.assertEqual(result["result"], 5)
-
-    def test_execute_sandbox_timeout(self):
-        # Code with infinite loop to trigger timeout
-        code = "while True:\n    pass"
-        runner = CodeSandboxRunner(code, compute_budget=100)
-        with self.assertRaises(TimeoutError):
-            runner.execute_sandbox(timeout_seconds=1)
-
-    def test_execute_sandbox_exception(self):
-        code = "raise ValueError('Test error')"
-        runner = CodeSandboxRunner(code, compute_budget=100)
-        with self.assertRaises(ValueError):
-            runner.execute_sandbox(timeout_seconds=2)
-
-    @patch("chaos_pack.foreign_code_sandbox.requests.get")
-    def test_import_code_from_github_repo_success(self, mock_get):
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.text = "print('Hello from GitHub')"
-        mock_get.return_value = mock_response
-
-        runner = CodeSandboxRunner("", compute_budget=100)
-        url = "https://github.com/user/repo/blob/main/file.py"
-        code = runner.import_code_from_github_repo(url)
-        self.assertEqual(code, "print('Hello from GitHub')")
-        mock_get.assert_called_once()
-
-    @patch("chaos_pack.foreign_code_sandbox.requests.get")
-    def test_import_code_from_github_repo_failure(self, mock_get):
-        mock_get.side_effect = Exception("Network error")
-        runner = CodeSandboxRunner("", compute_budget=100)
-        url = "https://github.com/user/repo/blob/main/file.py"
-        code = runner.import_code_from_github_repo(url)
-        self.assertEqual(code, "")
-
-    def test_execute_sandbox_feature_disabled(self):
-        # Temporarily disable the feature
-        EXPERIMENTAL_FEATURES["chaos_pack"] = False
-        runner = CodeSandboxRunner("print('test')", compute_budget=100)
-        result = runner.execute_sandbox(timeout_seconds=5)
-        # Should return None or default when feature is disabled
-        self.assertIsNone(result)
-        # Re-enable for other tests
-        EXPERIMENTAL_FEATURES["chaos_pack"] = True
-
-    def test_import_code_feature_disabled(self):
-        # Temporarily disable the feature
-        EXPERIMENTAL_FEATURES["chaos_pack"] = False
-        runner = CodeSandboxRunner("", compute_budget=100)
-        url = "https://github.com/user/repo/blob/main/file.py"
-        code = runner.import_code_from_github_repo(url)
-        self.assertEqual(code, "")
-        # Re-enable for other tests
-        EXPERIMENTAL_FEATURES["chaos_pack"] = True
-
-
-if __name__ == "__main__":
-    unittest.main()
+
+GITHUB_URL = "https://github.com/user/repo/blob/main/file.py"
+
+
+@pytest.fixture
+def chaos_flag(chaos_flag_factory):
+    return chaos_flag_factory(EXPERIMENTAL_FEATURES)
+
+
+@pytest.fixture
+def chaos_on(chaos_flag):
+    chaos_flag(True)
+
+
+@pytest.fixture
+def runner_factory():
+    return lambda code, budget=100: CodeSandboxRunner(code, compute_budget=budget)
+
+
+def test_compute_budget_calculation(runner_factory):
+    runner = runner_factory("print('test')", budget=50)
+    assert runner.compute_budget == 50
+
+
+@pytest.mark.parametrize(("code", "expected"), [
+    ("result = 2 + 3", 5),
+    ("result = sum(range(5))", 10),
+    ("result = max([3, 9, 4])", 9),
+    ("result = len('sandbox')", 7),
+], ids=["addition", "sum_range", "max_list", "len_str"])
+def test_execute_sandbox(chaos_on, runner_factory, code, expected):
+    result = runner_factory(code).execute_sandbox(timeout_seconds=5)
+    assert result["result"] == expected
+
+
+def test_execute_sandbox_timeout(chaos_on, runner_factory):
+    def non_daemon_threads():
+        return {t for t in threading.enumerate() if not t.daemon}
+
+    before = non_daemon_threads()
+    # Finite but slow loop (about a second), so the abandoned worker thread ends on its own
+    runner = runner_factory("total = 0\nfor i in range(10000000):\n    total += i")
+    start = time.monotonic()
+    with pytest.raises(TimeoutError):
+        runner.execute_sandbox(timeout_seconds=0.05)
+    # The timeout returns promptly even though the submitted code is still running
+    assert time.monotonic() - start < 0.5
+    assert runner._execution_thread.is_alive()
+    assert runner._execution_thread.daemon
+    assert non_daemon_threads() == before
+    # Let the abandoned thread finish so it does not compete with later tests
+    runner._execution_thread.join()
+
+
+def test_execute_sandbox_exception(chaos_on, runner_factory):
+    runner = runner_factory("raise ValueError('Test error')")
+    with pytest.raises(ValueError):
+        runner.execute_sandbox(timeout_seconds=2)
+
+
+@patch("chaos_pack.foreign_code_sandbox.requests.get")
+def test_import_code_from_github_repo_success(mock_get, chaos_on, runner_factory):
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.text = "print('Hello from GitHub')"
+    mock_get.return_value = mock_response
+
+    code = runner_factory("").import_code_from_github_repo(GITHUB_URL)
+    assert code == "print('Hello from GitHub')"
+    mock_get.assert_called_once()
+
+
+@patch("chaos_pack.foreign_code_sandbox.requests.get")
+def test_import_code_from_github_repo_failure(mock_get, chaos_on, runner_factory):
+    mock_get.side_effect = Exception("Network error")
+    code = runner_factory("").import_code_from_github_repo(GITHUB_URL)
+    assert code == ""
+
+
+def test_execute_sandbox_feature_disabled(chaos_flag, runner_factory):
+    chaos_flag(False)
+    result = runner_factory("print('test')").execute_sandbox(timeout_seconds=5)
+    # Should return None or default when feature is disabled
+    assert result is None
+
+
+def test_import_code_feature_disabled(chaos_flag, runner_factory):
+    chaos_flag(False)
+    code = runner_factory("").import_code_from_github_repo(GITHUB_URL)
+    assert code == ""
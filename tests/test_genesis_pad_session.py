@@ -2,9 +2,16 @@ import pytest
 from simulations.genesis_pad_session import GenesisPadSession
 
 
-def test_run_session_completes_without_user_input():
+@pytest.fixture(scope="module")
+def session_result():
+    # Both tests only check structural properties, so one run is shared
     session = GenesisPadSession()
     journal, capsule = session.run_session()
+    return session, journal, capsule
+
+
+def test_run_session_completes_without_user_input(session_result):
+    session, journal, _ = session_result
     # The journal should have entries for all prompts
     total_prompts = sum(len(prompts) for prompts in session.PROMPTS.values())
     assert len(journal) == total_prompts
@@ -16,9 +23,8 @@ def test_run_session_completes_without_user_input():
         assert "llm_metadata" in entry
 
 
-def test_genesis_capsule_is_complete_and_valid():
-    session = GenesisPadSession()
-    _, capsule = session.run_session()
+def test_genesis_capsule_is_complete_and_valid(session_result):
+    _, _, capsule = session_result
     # Capsule should be a dict with expected keys
     expected_keys = {"goal", "values", "tags",
                      "motivation_score", "public_snippet"}
@@ -0,0 +1,232 @@
+import json
+import sys
+import xml.etree.ElementTree as ET
+from datetime import datetime, timedelta
+
+import pytest
+from ui.interaction_map import InteractionMap, InteractionType
+
+BASE_TIME = datetime(2025, 1, 1, 12, 0, 0)
+
+
+@pytest.fixture
+def interaction_map():
+    imap = InteractionMap()
+    imap.record_interaction("agent_1", "agent_2", "trade", BASE_TIME)
+    imap.record_interaction("agent_1", "agent_3", "query", BASE_TIME + timedelta(seconds=1))
+    imap.record_interaction("agent_2", "agent_3", "trade", BASE_TIME + timedelta(seconds=2))
+    imap.record_interaction("agent_3", "agent_1", "trade", BASE_TIME + timedelta(seconds=3))
+    return imap
+
+
+def test_get_interactions_returns_newest_first(interaction_map):
+    interactions = interaction_map.get_interactions("agent_1")
+    assert [i["interaction_type"] for i in interactions] == ["trade", "query", "trade"]
+    timestamps = [i["timestamp"] for i in interactions]
+    assert timestamps == sorted(timestamps, reverse=True)
+
+
+def test_get_interactions_respects_limit(interaction_map):
+    interactions = interaction_map.get_interactions("agent_1", limit=2)
+    assert len(interactions) == 2
+    assert interactions[0]["timestamp"] == BASE_TIME + timedelta(seconds=3)
+
+
+def test_get_interactions_unknown_agent(interaction_map):
+    assert interaction_map.get_interactions("agent_99") == []
+    assert interaction_map.summarize_interactions("agent_99") == {
+        "interaction_counts": {}, "connected_agents": []}
+
+
+def test_get_interactions_out_of_order_timestamps(interaction_map):
+    interaction_map.record_interaction("agent_1", "agent_4", "query", BASE_TIME - timedelta(days=1))
+    interactions = interaction_map.get_interactions("agent_1")
+    timestamps = [i["timestamp"] for i in interactions]
+    assert timestamps == sorted(timestamps, reverse=True)
+    assert interactions[-1]["agent_b"] == "agent_4"
+    # Interactions recorded after the backdated one still come back newest first
+    interaction_map.record_interaction("agent_1", "agent_5", "trade", BASE_TIME + timedelta(seconds=2))
+    interaction_map.record_interaction("agent_1", "agent_6", "trade", BASE_TIME - timedelta(hours=1))
+    interactions = interaction_map.get_interactions("agent_1")
+    assert [i["agent_b"] for i in interactions] == ["agent_1", "agent_5", "agent_3", "agent_2", "agent_6", "agent_4"]
+    assert [i["agent_b"] for i in interaction_map.get_interactions("agent_1", limit=2)] == ["agent_1", "agent_5"]
+
+
+@pytest.mark.parametrize("chronological", [True, False], ids=["in_order", "backdated"])
+def test_get_interactions_since(interaction_map, chronological):
+    if not chronological:
+        interaction_map.record_interaction("agent_1", "agent_4", "query", BASE_TIME - timedelta(days=1))
+    interactions = interaction_map.get_interactions_since("agent_1", BASE_TIME + timedelta(seconds=1))
+    assert [i["timestamp"] for i in interactions] == [
+        BASE_TIME + timedelta(seconds=3), BASE_TIME + timedelta(seconds=1)]
+    assert interaction_map.get_interactions_since("agent_99", BASE_TIME) == []
+
+
+def test_equal_timestamps_order_is_stable_across_backdating(interaction_map):
+    tied = BASE_TIME + timedelta(seconds=5)
+    interaction_map.record_interaction("agent_1", "agent_2", "b", tied)
+    interaction_map.record_interaction("agent_1", "agent_2", "c", tied)
+    expected = ["c", "b"]
+    assert [i["interaction_type"] for i in interaction_map.get_interactions("agent_1", limit=2)] == expected
+    # A backdated interaction does not disturb the order of equal timestamps
+    interaction_map.record_interaction("agent_1", "agent_4", "query", BASE_TIME - timedelta(days=1))
+    for agent_id in ("agent_1", "agent_2"):
+        assert [i["interaction_type"] for i in interaction_map.get_interactions(agent_id, limit=2)] == expected
+        since = interaction_map.get_interactions_since(agent_id, tied)
+        assert [i["interaction_type"] for i in since] == expected
+    # A backdated interaction tied with an earlier one comes back before it, as the later recorded
+    interaction_map.record_interaction("agent_1", "agent_3", "d", BASE_TIME + timedelta(seconds=1))
+    interactions = interaction_map.get_interactions_since("agent_1", BASE_TIME + timedelta(seconds=1))
+    assert [i["interaction_type"] for i in interactions] == ["c", "b", "trade", "d", "query"]
+
+
+def test_summarize_interactions(interaction_map):
+    summary = interaction_map.summarize_interactions("agent_1")
+    assert summary["interaction_counts"] == {"trade": 2, "query": 1}
+    assert sorted(summary["connected_agents"]) == ["agent_2", "agent_3"]
+
+
+def test_record_interaction_accepts_type_codes(interaction_map):
+    interaction_map.record_interaction("agent_1", "agent_2", InteractionType.VISIBILITY_SHARE)
+    assert interaction_map.get_interactions("agent_1", limit=1)[0]["interaction_type"] == "visibility_share"
+    assert interaction_map.summarize_interactions("agent_2")["interaction_counts"]["trade"] == 2
+
+
+def test_summarize_interactions_self_interaction(interaction_map):
+    interaction_map.record_interaction("agent_4", "agent_4", "query")
+    assert interaction_map.summarize_interactions("agent_4") == {
+        "interaction_counts": {"query": 1}, "connected_agents": ["agent_4"]}
+
+
+def test_record_interaction_interns_agent_ids():
+    imap = InteractionMap()
+    agent_id = "".join(["agent_", "42"])
+    imap.record_interaction(agent_id, "agent_1", "trade")
+    imap.record_coalition_membership(1, ["".join(["agent_", "7"])])
+    assert imap.interactions[0]["agent_a"] is sys.intern("agent_42")
+    assert imap.coalition_memberships[1][0] is sys.intern("agent_7")
+
+
+def test_get_relationship_links(interaction_map):
+    links = interaction_map.get_relationship_links()
+    assert {agent: sorted(neighbors) for agent, neighbors in links.items()} == {
+        "agent_1": ["agent_2", "agent_3"],
+        "agent_2": ["agent_1", "agent_3"],
+        "agent_3": ["agent_1", "agent_2"],
+    }
+
+
+def test_get_relationship_links_sees_new_links(interaction_map):
+    links = interaction_map.get_relationship_links()
+    # Repeat interactions between linked agents leave the links unchanged
+    interaction_map.record_interaction("agent_1", "agent_2", "query")
+    assert interaction_map.get_relationship_links() == links
+    interaction_map.record_interaction("agent_1", "agent_4", "query")
+    links = interaction_map.get_relationship_links()
+    assert links["agent_4"] == ["agent_1"]
+    assert "agent_4" in links["agent_1"]
+
+
+def test_get_relationship_links_returns_copies(interaction_map):
+    links = interaction_map.get_relationship_links()
+    links["agent_1"].append("agent_99")
+    del links["agent_2"]
+    links = interaction_map.get_relationship_links()
+    assert sorted(links["agent_1"]) == ["agent_2", "agent_3"]
+    assert "agent_2" in links
+
+
+def test_export_snapshot_is_fixed_at_step(interaction_map):
+    interaction_map.record_coalition_membership(1, ["agent_1"])
+    snapshot = interaction_map.export_snapshot(step=1)
+    interaction_map.record_interaction("agent_1", "agent_4", "query")
+    interaction_map.record_coalition_membership(2, ["agent_4"])
+
+    assert snapshot["step"] == 1
+    assert snapshot["coalitions"] == {1: ["agent_1"]}
+    assert len(snapshot["interactions"]) == 4
+    assert snapshot["interactions"] is snapshot["interactions"]
+    assert dict(snapshot).keys() == {"step", "coalitions", "interactions"}
+    assert len(interaction_map.export_snapshot(step=2)["interactions"]) == 5
+
+
+def test_export_snapshot_behaves_as_dict(interaction_map):
+    snapshot = interaction_map.export_snapshot(step=1)
+    interaction_map.record_interaction("agent_1", "agent_4", "query")
+    assert isinstance(snapshot, dict)
+    assert len(json.loads(json.dumps(snapshot, default=str))["interactions"]) == 4
+    snapshot["step"] = 2
+    assert snapshot == {"step": 2, "coalitions": {}, "interactions": interaction_map.interactions[:4]}
+    assert interaction_map.snapshots[0]["step"] == 2
+
+
+def test_export_json_empty(tmp_path):
+    imap = InteractionMap()
+    imap.export_snapshot(step=0)
+    filepath = tmp_path / "map.json"
+    imap.export_json(str(filepath))
+    assert json.loads(filepath.read_text()) == [
+        {"step": 0, "coalitions": {}, "interactions": []}]
+
+
+@pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "stdlib"])
+def test_export_json(interaction_map, tmp_path, monkeypatch, use_orjson):
+    if use_orjson:
+        pytest.importorskip("orjson")
+    monkeypatch.setattr("ui.interaction_map.ORJSON_AVAILABLE", use_orjson)
+    interaction_map.record_coalition_membership(1, ["agent_1", "agent_2"])
+    interaction_map.export_snapshot(step=1)
+    interaction_map.export_snapshot(step=2)
+    filepath = tmp_path / "map.json"
+    interaction_map.export_json(str(filepath))
+
+    snapshots = json.loads(filepath.read_text())
+    assert [s["step"] for s in snapshots] == [1, 2]
+    assert snapshots[0]["coalitions"] == {"1": ["agent_1", "agent_2"]}
+    assert snapshots[0]["interactions"][0] == {
+        "agent_a": "agent_1", "agent_b": "agent_2",
+        "interaction_type": "trade", "timestamp": "2025-01-01T12:00:00"}
+
+
+def test_export_graphml(interaction_map, tmp_path):
+    interaction_map.record_coalition_membership(1, ["agent_1", "agent_5"])
+    filepath = tmp_path / "map.graphml"
+    interaction_map.export_graphml(str(filepath))
+
+    ns = "{http://graphml.graphdrawing.org/xmlns}"
+    root = ET.parse(filepath).getroot()
+    keys = {(k.get("id"), k.get("for"), k.get("attr.type")) for k in root.iter(f"{ns}key")}
+    assert keys == {("type", "node", "string"), ("interaction_type", "edge", "string"), ("weight", "edge", "int")}
+    graph = root.find(f"{ns}graph")
+    nodes = {node.get("id"): node[0].text for node in graph.iter(f"{ns}node")}
+    assert nodes == {
+        "coalition_1": "coalition",
+        "agent_1": "agent",
+        "agent_2": "agent",
+        "agent_3": "agent",
+        "agent_5": "agent",
+    }
+    edges = {(e.get("source"), e.get("target"), e[0].text): [d.text for d in e[1:]]
+             for e in graph.iter(f"{ns}edge")}
+    assert edges == {
+        ("agent_1", "agent_2", "trade"): ["1"],
+        ("agent_1", "agent_3", "query"): ["1"],
+        ("agent_2", "agent_3", "trade"): ["1"],
+        ("agent_1", "agent_3", "trade"): ["1"],
+        ("coalition_1", "agent_1", "coalition_membership"): [],
+        ("coalition_1", "agent_5", "coalition_membership"): [],
+    }
+
+
+def test_export_graphml_collapses_repeated_interactions(interaction_map, tmp_path):
+    interaction_map.record_interaction("agent_2", "agent_1", "trade")
+    interaction_map.record_interaction("agent_1", "agent_2", "trade")
+    filepath = tmp_path / "map.graphml"
+    interaction_map.export_graphml(str(filepath))
+
+    ns = "{http://graphml.graphdrawing.org/xmlns}"
+    edges = [e for e in ET.parse(filepath).iter(f"{ns}edge")
+             if (e.get("source"), e.get("target")) == ("agent_1", "agent_2")]
+    assert len(edges) == 1
+    assert edges[0][1].get("key") == "weight"
+    assert edges[0][1].text == "3"
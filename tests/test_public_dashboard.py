@@ -0,0 +1,68 @@
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+from ui.interaction_map import InteractionMap
+from ui.public_dashboard import PublicDashboard
+from ui.social_feed import SocialFeed
+
+
+@pytest.fixture
+def dashboard():
+    feed = SocialFeed()
+    feed.append_post("agent_1", "hello", timestamp=datetime(2025, 1, 1))
+    imap = InteractionMap()
+    imap.record_interaction("agent_1", "agent_2", "trade", datetime(2025, 1, 1))
+    return PublicDashboard(feed, imap, MagicMock())
+
+
+def test_get_feed_cached_within_ttl(dashboard):
+    first = dashboard.get_feed("agent_1", limit=10)
+    dashboard.social_feed.append_post("agent_1", "again")
+    assert dashboard.get_feed("agent_1", limit=10) == first
+    # Different arguments are cached separately
+    assert len(dashboard.get_feed("agent_1", limit=5)["entries"]) == 2
+
+
+def test_get_interaction_map_refreshes_after_ttl(dashboard, monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("ui.public_dashboard.time.monotonic", lambda: now[0])
+    links = dashboard.get_interaction_map()["relationship_links"]
+    assert links == {"agent_1": ["agent_2"], "agent_2": ["agent_1"]}
+    dashboard.interaction_map.record_interaction("agent_3", "agent_1", "query")
+    assert "agent_3" not in dashboard.get_interaction_map()["relationship_links"]
+    now[0] += dashboard.cache_ttl
+    assert "agent_3" in dashboard.get_interaction_map()["relationship_links"]
+
+
+def test_cache_disabled(dashboard):
+    dashboard.cache_ttl = 0
+    dashboard.get_snapshot("agent_1")
+    dashboard.get_snapshot("agent_1")
+    assert dashboard.snapshot_panel.get_agent_snapshot.call_count == 2
+    assert dashboard._cache == {}
+
+
+def test_cached_responses_are_copies(dashboard):
+    first = dashboard.get_feed("agent_1")
+    first["entries"].clear()
+    first["extra"] = True
+    second = dashboard.get_feed("agent_1")
+    assert len(second["entries"]) == 1
+    assert "extra" not in second
+
+
+def test_cached_nested_entries_are_copies(dashboard):
+    first = dashboard.get_feed("agent_1")
+    first["entries"][0]["content"] = "edited"
+    assert dashboard.get_feed("agent_1")["entries"][0]["content"] == "hello"
+    interactions = dashboard.get_interaction_map("agent_1")["interactions"]
+    interactions[0]["interaction_type"] = "edited"
+    assert dashboard.get_interaction_map("agent_1")["interactions"][0]["interaction_type"] == "trade"
+
+
+def test_cache_maxsize(dashboard):
+    dashboard.cache_maxsize = 2
+    for limit in range(1, 5):
+        dashboard.get_feed(limit=limit)
+    assert len(dashboard._cache) == 2
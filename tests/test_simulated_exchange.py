@@ -0,0 +1,75 @@
+from types import SimpleNamespace
+
+import pytest
+from trading import simulated_exchange
+from trading.simulated_exchange import propose_trade, propose_trades
+
+
+def _receiver(tags):
+    return SimpleNamespace(capsule_data={"tags": tags})
+
+
+@pytest.mark.parametrize(("item_tags", "expected_score", "accepted"), [
+    (["art", "rare"], 0.6, True),
+    (["art", "music"], 0.3, True),
+    (["music"], 0.0, False),
+    ([], 0.0, False),
+])
+def test_propose_trade_scores_tag_overlap(item_tags, expected_score, accepted):
+    result = propose_trade(None, _receiver(["art", "rare", "digital"]), {"item_tags": item_tags})
+    assert result["score"] == pytest.approx(expected_score)
+    assert result["accepted"] is accepted
+
+
+def test_propose_trade_prefers_agent_tags():
+    receiver = _receiver(["music"])
+    receiver.tags = ["art"]
+    result = propose_trade(None, receiver, {"item_tags": ["art"]})
+    assert result["score"] == pytest.approx(0.3)
+
+
+def test_propose_trade_sees_reassigned_agent_tags():
+    from agents.agent import Agent
+    receiver = Agent(capsule_data={"capsule_id": "capsule-abc", "tags": ["music"]})
+    receiver.tags = ["art"]
+    assert propose_trade(None, receiver, {"item_tags": ["art"]})["score"] == pytest.approx(0.3)
+    assert propose_trades([(None, receiver, {"item_tags": ["music"]})])[0]["score"] == 0.0
+
+
+def test_propose_trade_sees_in_place_tag_edits():
+    from agents.agent import Agent
+    receiver = Agent(capsule_data={"capsule_id": "capsule-abc", "tags": ["music"]})
+    assert propose_trade(None, receiver, {"item_tags": ["art"]})["score"] == 0.0
+    receiver.tags.append("art")
+    assert propose_trade(None, receiver, {"item_tags": ["art"]})["score"] == pytest.approx(0.3)
+    receiver.capsule_data["tags"].append("rare")
+    assert propose_trades([(None, receiver, {"item_tags": ["rare"]})])[0]["score"] == pytest.approx(0.3)
+
+
+def test_propose_trade_receiver_without_tags():
+    receiver = SimpleNamespace(capsule_data={})
+    result = propose_trade(None, receiver, {"item_tags": ["art"]})
+    assert result == {"accepted": False, "score": 0.0, "proposal": {"item_tags": ["art"]}}
+
+
+@pytest.mark.parametrize("use_numba", [True, False], ids=["numba", "python"])
+def test_propose_trades_matches_propose_trade(monkeypatch, use_numba):
+    if use_numba:
+        pytest.importorskip("numba")
+    else:
+        monkeypatch.setattr(simulated_exchange, "_score_batch_kernel", lambda: None)
+    receivers = [_receiver(["art", "rare"]), _receiver(["music"]), _receiver([])]
+    offers = [{"item_tags": ["art", "rare", "digital"]}, {"item_tags": ["music", "art"]}, {}]
+    proposals = [(None, receiver, offer) for receiver in receivers for offer in offers]
+
+    results = propose_trades(proposals)
+    assert len(results) == len(proposals)
+    for result, proposal in zip(results, proposals):
+        expected = propose_trade(*proposal)
+        assert result["score"] == pytest.approx(expected["score"])
+        assert result["accepted"] is expected["accepted"]
+        assert result["proposal"] is proposal[2]
+
+
+def test_propose_trades_empty_batch():
+    assert propose_trades([]) == []
@@ -0,0 +1,109 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from agents.agent import Agent, AgentIdentity
+from ui.snapshot_panel import SnapshotPanel
+from visibility.visibility_preferences import VisibilityPreferences
+
+
+@pytest.fixture
+def agent():
+    return SimpleNamespace(public_snippet="Collector of rare art", tags=["art_lover", "collector"],
+                           goal="Acquire rare digital art", values=["creativity"],
+                           wallet_address="0xabc", nft_assigned=True)
+
+
+@pytest.fixture
+def panel(agent):
+    return SnapshotPanel(agent, VisibilityPreferences("agent_1"), agent_registry={"agent_1": agent})
+
+
+def test_get_agent_snapshot(panel):
+    assert panel.get_agent_snapshot("agent_1") == {
+        "public_snippet": "Collector of rare art",
+        "top_badge": "art_lover",
+        "current_mood": "neutral",
+        "shared_attributes": {
+            "goal": "Acquire rare digital art",
+            "values": ["creativity"],
+            "wallet_address": "0xabc",
+            "nft_assigned": True,
+        },
+    }
+    assert panel.get_agent_snapshot("agent_99") == {}
+
+
+def test_get_agent_snapshot_defaults():
+    panel = SnapshotPanel(None, None, agent_registry={"bare": SimpleNamespace()})
+    snapshot = panel.get_agent_snapshot("bare")
+    assert snapshot["top_badge"] is None
+    assert snapshot["shared_attributes"] == {
+        "goal": None, "values": None, "wallet_address": None, "nft_assigned": False}
+
+
+def test_get_shared_attributes(panel):
+    assert panel.get_shared_attributes()["nft_assigned"] is True
+
+
+def test_toggle_visibility_preference(panel):
+    panel.toggle_visibility_preference("show_goal")
+    assert panel.get_visibility_preferences()["show_goal"] is True
+    panel.toggle_visibility_preference("show_goal")
+    assert panel.get_visibility_preferences()["show_goal"] is False
+
+
+def test_toggle_reads_view_without_copying(panel, monkeypatch):
+    preferences = VisibilityPreferences("agent_2")
+    monkeypatch.setattr(preferences, "get_preferences",
+                        lambda: pytest.fail("toggle should not copy preferences"))
+    panel.visibility_preferences = preferences
+    panel.toggle_visibility_preference("show_badges")
+    assert preferences.view_preferences()["show_badges"] is True
+
+
+def test_visibility_capabilities_follow_reassignment(panel):
+    panel.visibility_preferences = SimpleNamespace(
+        get_agent_preferences=lambda agent_id: {"agent": agent_id})
+    assert panel.get_visibility_preferences() == {}
+    assert panel.query_visibility_state("agent_1") == {"agent": "agent_1"}
+    # No update_preference capability: toggling is a no-op
+    panel.toggle_visibility_preference("show_goal")
+
+
+def test_get_agent_snapshot_uses_agent_snapshot_view():
+    class ViewAgent:
+        def snapshot_view(self):
+            return {"public_snippet": "built", "top_badge": None, "current_mood": "neutral",
+                    "shared_attributes": {}}
+
+    panel = SnapshotPanel(None, None, agent_registry={"agent_1": ViewAgent()})
+    assert panel.get_agent_snapshot("agent_1")["public_snippet"] == "built"
+
+
+def test_get_agent_snapshot_mock_agent_takes_attribute_path():
+    agent = MagicMock(public_snippet="mocked", tags=["art"], goal="g", values=None,
+                      wallet_address="0xabc", nft_assigned=True)
+    panel = SnapshotPanel(None, None, agent_registry={"agent_1": agent})
+    snapshot = panel.get_agent_snapshot("agent_1")
+    assert snapshot["public_snippet"] == "mocked"
+    assert snapshot["shared_attributes"] == {
+        "goal": "g", "values": None, "wallet_address": "0xabc", "nft_assigned": True}
+
+
+def test_agent_snapshot_view_is_live():
+    identity = AgentIdentity(agent_id="agent_1", capsule_id="capsule-abc")
+    agent = Agent(capsule_data={"capsule_id": "capsule-abc", "goal": "Trade", "tags": ["collector"]},
+                  agent_identity=identity)
+    panel = SnapshotPanel(agent, None, agent_registry={"agent_1": agent})
+    assert panel.get_agent_snapshot("agent_1")["top_badge"] == "collector"
+    agent.tags.insert(0, "trader")
+    identity.wallet_address = "0xabc"
+    identity.nft_assigned = True
+    snapshot = panel.get_agent_snapshot("agent_1")
+    assert snapshot["top_badge"] == "trader"
+    assert snapshot["shared_attributes"]["wallet_address"] == "0xabc"
+    assert snapshot["shared_attributes"]["nft_assigned"] is True
+    # Each call builds a new dict
+    snapshot["shared_attributes"]["goal"] = "changed"
+    assert panel.get_agent_snapshot("agent_1")["shared_attributes"]["goal"] == "Trade"
@@ -0,0 +1,133 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from ui.social_feed import FeedEntry, SocialFeed, timestamp_to_datetime
+
+BASE_TIME = datetime(2025, 1, 1, 12, 0, 0)
+
+
+@pytest.fixture
+def feed():
+    feed = SocialFeed()
+    feed.append_post("agent_1", "hello", mood="happy", timestamp=BASE_TIME)
+    feed.append_event_log("agent_2", "joined", timestamp=BASE_TIME + timedelta(seconds=2))
+    feed.append_trade_reflection("agent_1", "traded", timestamp=BASE_TIME + timedelta(seconds=3))
+    feed.append_post("agent_1", "again", timestamp=BASE_TIME + timedelta(seconds=4))
+    return feed
+
+
+def test_get_recent_entries_newest_first(feed):
+    entries = feed.get_recent_entries()
+    assert [e["content"] for e in entries] == ["again", "traded", "joined", "hello"]
+    assert [e["content"] for e in feed.get_recent_entries(limit=2)] == ["again", "traded"]
+
+
+def test_get_entries_by_agent(feed):
+    entries = feed.get_entries_by_agent("agent_1", limit=2)
+    assert [e["content"] for e in entries] == ["again", "traded"]
+    assert entries[1]["type"] == "trade_reflection"
+    assert feed.get_entries_by_agent("agent_99") == []
+
+
+def test_out_of_order_timestamps(feed):
+    feed.append_post("agent_1", "backdated", timestamp=BASE_TIME - timedelta(days=1))
+    feed.append_post("agent_2", "mid", timestamp=BASE_TIME + timedelta(seconds=1))
+    assert [e["content"] for e in feed.get_recent_entries(limit=3)] == ["again", "traded", "joined"]
+    entries = feed.get_entries_by_agent("agent_1")
+    assert [e["content"] for e in entries] == ["again", "traded", "hello", "backdated"]
+    # Entries appended after backdated ones still come back newest first
+    feed.append_post("agent_2", "latest", timestamp=BASE_TIME + timedelta(seconds=5))
+    feed.append_post("agent_1", "older", timestamp=BASE_TIME - timedelta(hours=1))
+    contents = [e["content"] for e in feed.get_recent_entries()]
+    assert contents == ["latest", "again", "traded", "joined", "mid", "hello", "older", "backdated"]
+    assert [e["content"] for e in feed.get_recent_entries(limit=2)] == ["latest", "again"]
+
+
+def test_iter_recent_entries_is_lazy(feed):
+    entries = feed.iter_recent_entries(limit=1)
+    feed.append_post("agent_3", "latest", timestamp=BASE_TIME + timedelta(seconds=10))
+    assert [e["content"] for e in entries] == ["latest"]
+
+
+def test_bulk_append_shares_one_timestamp(feed):
+    feed.bulk_append([
+        ("post", "agent_3", "gm", "cheerful"),
+        ("event_log", "agent_3", "joined", "ignored"),
+        ("trade_reflection", "agent_4", "good deal", None),
+    ], timestamp=BASE_TIME + timedelta(seconds=5))
+    entries = feed.get_recent_entries(limit=3)
+    assert {timestamp_to_datetime(e["timestamp"]) for e in entries} == {BASE_TIME + timedelta(seconds=5)}
+    assert [e["mood"] for e in feed.get_entries_by_agent("agent_3")] == [None, "cheerful"]
+
+
+def test_bulk_append_rejects_unknown_type(feed):
+    with pytest.raises(ValueError):
+        feed.bulk_append([("shout", "agent_1", "hi", None)])
+    # An invalid item mid-batch leaves the feed untouched
+    with pytest.raises(ValueError):
+        feed.bulk_append([("post", "agent_5", "ok", None), ("shout", "agent_5", "hi", None)])
+    assert feed.get_entries_by_agent("agent_5") == []
+    assert len(feed.get_recent_entries()) == 4
+
+
+def test_timestamps_stored_as_epoch_seconds(feed):
+    feed.append_post("agent_3", "aware", timestamp=datetime(2025, 1, 1, 13, 0, tzinfo=timezone(timedelta(hours=1))))
+    feed.append_post("agent_3", "epoch", timestamp=BASE_TIME.replace(tzinfo=timezone.utc).timestamp() + 10)
+    feed.append_post("agent_3", "now")
+    entries = feed.get_entries_by_agent("agent_3")
+    assert [e["content"] for e in entries] == ["now", "epoch", "aware"]
+    assert all(type(e["timestamp"]) is float for e in entries)
+    # Naive datetimes are UTC; the aware one is the same instant as BASE_TIME
+    assert timestamp_to_datetime(entries[2]["timestamp"]) == BASE_TIME
+    assert timestamp_to_datetime(feed.get_entries_by_agent("agent_1")[-1]["timestamp"]) == BASE_TIME
+
+
+def test_entries_stored_as_slotted_records(feed):
+    feed.flush()
+    assert all(isinstance(e, FeedEntry) for e in feed.entries)
+    assert not hasattr(feed.entries[0], "__dict__")
+    # Returned dicts are copies; editing them leaves the feed unchanged
+    feed.get_recent_entries(limit=1)[0]["content"] = "edited"
+    assert feed.get_recent_entries(limit=1)[0] == feed.entries[-1].to_dict()
+    assert feed.entries[-1].content == "again"
+
+
+def test_appends_are_buffered_until_read():
+    feed = SocialFeed(buffer_size=3, flush_interval=60)
+    feed.append_post("agent_1", "first", timestamp=BASE_TIME)
+    feed.append_post("agent_2", "second", timestamp=BASE_TIME - timedelta(seconds=1))
+    assert feed.entries == []
+    # Reads flush the buffer first
+    assert [e["content"] for e in feed.get_entries_by_agent("agent_2")] == ["second"]
+    assert len(feed.entries) == 2
+    feed.bulk_append([("post", "agent_3", c, None) for c in ("a", "b", "c")],
+                     timestamp=BASE_TIME + timedelta(seconds=1))
+    # A full buffer flushes without a read
+    assert len(feed.entries) == 5
+    assert [e["content"] for e in feed.get_recent_entries(limit=3)] == ["c", "b", "a"]
+
+
+def test_buffer_flushes_after_interval(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr("ui.social_feed.time.monotonic", lambda: now[0])
+    feed = SocialFeed(buffer_size=100, flush_interval=1.0)
+    feed.append_post("agent_1", "early", timestamp=BASE_TIME)
+    assert feed.entries == []
+    now[0] = 2.0
+    feed.append_post("agent_1", "late", timestamp=BASE_TIME)
+    assert [e.content for e in feed.entries] == ["early", "late"]
+
+
+def test_equal_timestamps_order_is_stable_across_backdating(feed):
+    feed.bulk_append([("post", "agent_3", "first", None), ("post", "agent_3", "second", None)],
+                     timestamp=BASE_TIME + timedelta(seconds=5))
+    expected = ["second", "first"]
+    assert [e["content"] for e in feed.get_recent_entries(limit=2)] == expected
+    # A backdated post does not disturb the order of equal timestamps
+    feed.append_post("agent_1", "backdated", timestamp=BASE_TIME - timedelta(days=1))
+    assert [e["content"] for e in feed.get_recent_entries(limit=2)] == expected
+    assert [e["content"] for e in feed.get_entries_by_agent("agent_3")] == expected
+    # A backdated post tied with an earlier one comes back before it, as the later appended
+    feed.append_post("agent_1", "tied", timestamp=BASE_TIME + timedelta(seconds=3))
+    assert [e["content"] for e in feed.get_entries_by_agent("agent_1", limit=3)] == ["again", "tied", "traded"]
+    assert [e["content"] for e in feed.get_recent_entries(limit=5)] == ["second", "first", "again", "tied", "traded"]
@@ -0,0 +1,146 @@
+import logging
+
+import pytest
+from visibility import visibility_preferences
+from visibility.visibility_preferences import VisibilityPreferences, VisibilityPreferencesRegistry
+
+
+@pytest.fixture
+def owner():
+    return VisibilityPreferences("agent_1")
+
+
+@pytest.fixture
+def viewer():
+    return VisibilityPreferences("agent_2")
+
+
+@pytest.fixture
+def log_state(monkeypatch, tmp_path):
+    # Fresh lazy-logging state in an empty directory; added handlers are removed afterwards
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(visibility_preferences, "_log_configured", False)
+    logger = visibility_preferences.logger
+    handlers, level = list(logger.handlers), logger.level
+    yield tmp_path
+    for handler in logger.handlers[len(handlers):]:
+        handler.close()
+    logger.handlers[:] = handlers
+    logger.setLevel(level)
+
+
+@pytest.mark.parametrize(("env", "expected"), [("1", True), ("0", False)], ids=["enabled", "disabled"])
+def test_log_file_attached_on_first_update(log_state, monkeypatch, owner, env, expected):
+    monkeypatch.setenv("VISPREF_LOG", env)
+    assert not (log_state / "visibility_preferences.log").exists()
+    owner.update_preference("show_goal", True)
+    owner.update_preference("show_badges", True)
+    file_handlers = [h for h in visibility_preferences.logger.handlers if isinstance(h, logging.FileHandler)]
+    assert len(file_handlers) == int(expected)
+    assert (log_state / "visibility_preferences.log").exists() is expected
+
+
+def test_defaults_hide_everything(owner):
+    prefs = owner.get_preferences()
+    assert prefs.keys() == VisibilityPreferences.VALID_CATEGORIES
+    assert not any(prefs.values())
+
+
+def test_update_preference(owner):
+    owner.update_preference("show_goal", True)
+    owner.update_preference("show_badges", True)
+    owner.update_preference("show_badges", False)
+    prefs = owner.get_preferences()
+    assert prefs["show_goal"] is True
+    assert prefs["show_badges"] is False
+    # get_preferences hands out a copy
+    prefs["show_badges"] = True
+    assert owner.get_preferences()["show_badges"] is False
+
+
+def test_view_preferences_is_live_and_read_only(owner):
+    view = owner.view_preferences()
+    assert owner.view_preferences() is view
+    assert dict(view) == owner.get_preferences()
+    owner.update_preference("show_goal", True)
+    assert view["show_goal"] is True
+    assert view.get("show_secrets", False) is False
+    with pytest.raises(TypeError):
+        view["show_goal"] = False
+
+
+def test_preferences_rejects_item_assignment(owner):
+    with pytest.raises(TypeError):
+        owner.preferences["show_goal"] = True
+    owner.update_preference("show_goal", True)
+    assert owner.preferences["show_goal"] is True
+
+
+def test_debug_logging_off_by_default(log_state, monkeypatch, owner):
+    monkeypatch.setenv("VISPREF_LOG", "1")
+    logger = visibility_preferences.logger
+    assert logger.level == logging.NOTSET
+    owner.update_preference("show_goal", True)
+    # Attaching the file handler enables INFO records, not DEBUG
+    assert logger.getEffectiveLevel() == logging.INFO
+
+
+@pytest.mark.parametrize(("owner_shares", "viewer_shares", "expected"), [
+    (True, True, True),
+    (True, False, False),
+    (False, True, False),
+    (False, False, False),
+])
+def test_can_view_is_reciprocal(owner, viewer, owner_shares, viewer_shares, expected):
+    owner.update_preference("show_goal", owner_shares)
+    viewer.update_preference("show_goal", viewer_shares)
+    viewer.update_preference("show_badges", True)
+    assert owner.can_view(viewer, "show_goal") is expected
+
+
+def test_invalid_category(owner, viewer):
+    with pytest.raises(ValueError):
+        owner.update_preference("show_secrets", True)
+    with pytest.raises(ValueError):
+        owner.can_view(viewer, "show_secrets")
+
+
+@pytest.fixture
+def registry():
+    registry = VisibilityPreferencesRegistry()
+    registry.update_preference("agent_1", "show_goal", True)
+    registry.update_preference("agent_2", "show_goal", True)
+    registry.update_preference("agent_3", "show_badges", True)
+    return registry
+
+
+@pytest.mark.parametrize("use_numpy", [True, False], ids=["numpy", "python"])
+def test_registry_can_view_matrix(registry, monkeypatch, use_numpy):
+    if use_numpy:
+        pytest.importorskip("numpy")
+    monkeypatch.setattr("visibility.visibility_preferences.NUMPY_AVAILABLE", use_numpy)
+    matrix = registry.can_view_matrix(["agent_1", "agent_3"], ["agent_1", "agent_2", "agent_3", "agent_9"], "show_goal")
+    assert matrix == [[True, True, False, False], [False, False, False, False]]
+    assert registry.can_view_matrix([], ["agent_1"], "show_goal") == []
+
+
+def test_registry_update_and_can_view(registry):
+    assert registry.can_view("agent_1", "agent_2", "show_goal") is True
+    registry.update_preference("agent_2", "show_goal", False)
+    assert registry.can_view("agent_1", "agent_2", "show_goal") is False
+    with pytest.raises(ValueError):
+        registry.update_preference("agent_1", "show_secrets", True)
+    with pytest.raises(ValueError):
+        registry.can_view_matrix(["agent_1"], ["agent_2"], "show_secrets")
+
+
+@pytest.mark.parametrize("use_numba", [True, False], ids=["numba", "python"])
+def test_registry_reciprocal_counts(registry, monkeypatch, use_numba):
+    if use_numba:
+        pytest.importorskip("numba")
+    else:
+        monkeypatch.setattr(visibility_preferences, "_eligibility_kernel", lambda: None)
+    assert registry.reciprocal_counts("show_goal") == {"agent_1": 1, "agent_2": 1, "agent_3": 0}
+    registry.update_preference("agent_3", "show_goal", True)
+    assert registry.reciprocal_counts("show_goal") == {"agent_1": 2, "agent_2": 2, "agent_3": 2}
+    assert VisibilityPreferencesRegistry().reciprocal_counts("show_goal") == {}
@@ -1,55 +1,79 @@
-import unittest
 import logging
 from unittest.mock import patch
 
+import pytest
+
 import chaos_pack.world_dynamics as wd
 
 
-class TestBlackSwanEngine(unittest.TestCase):
+@pytest.fixture
+def chaos_flag(chaos_flag_factory):
+    return chaos_flag_factory(wd.EXPERIMENTAL_FEATURES)
+
+
+@pytest.fixture
+def bs_flag():
+    # Setter for the Black Swan circuit breaker; restored afterwards
+    original = wd._black_swan_enabled
+
+    def set_enabled(enabled):
+        if enabled:
+            wd.enable_black_swan_engine()
+        else:
+            wd.disable_black_swan_engine()
 
-    def setUp(self):
+    yield set_enabled
+    set_enabled(original)
+
+
+class TestBlackSwanEngine:
+
+    @pytest.fixture(autouse=True)
+    def _setup(self, caplog, chaos_flag, bs_flag):
+        # caplog.set_level also lifts the session-wide logging.disable()
+        caplog.set_level(logging.ERROR)
         # Ensure engine is enabled before each test
-        wd.enable_black_swan_engine()
-        wd.EXPERIMENTAL_FEATURES["chaos_pack"] = True
+        chaos_flag(True)
+        bs_flag(True)
 
-    def test_feature_flag_disabled(self):
-        wd.EXPERIMENTAL_FEATURES["chaos_pack"] = False
+    def test_feature_flag_disabled(self, chaos_flag):
+        chaos_flag(False)
         event_id = wd.inject_chaotic_event()
-        self.assertIsNone(event_id)
-        wd.EXPERIMENTAL_FEATURES["chaos_pack"] = True
+        assert event_id is None
 
-    def test_safety_circuit_breaker_disabled(self):
-        wd.disable_black_swan_engine()
+    def test_safety_circuit_breaker_disabled(self, bs_flag):
+        bs_flag(False)
         event_id = wd.inject_chaotic_event()
-        self.assertIsNone(event_id)
-        wd.enable_black_swan_engine()
+        assert event_id is None
 
     def test_manual_event_valid(self):
         event_id = wd.inject_chaotic_event(manual_event="trade_freeze")
-        self.assertIsNotNone(event_id)
+        assert event_id is not None
 
-    def test_manual_event_invalid(self):
-        with self.assertLogs(level='ERROR') as log:
-            event_id = wd.inject_chaotic_event(manual_event="invalid_event")
-            self.assertIsNone(event_id)
-            self.assertTrue(
-                any("Invalid manual_event" in message for message in log.output))
+    def test_manual_event_invalid(self, caplog):
+        event_id = wd.inject_chaotic_event(manual_event="invalid_event")
+        assert event_id is None
+        assert any("Invalid manual_event" in r.message for r in caplog.records)
 
     def test_stochastic_event(self):
         event_id = wd.inject_chaotic_event()
-        self.assertIsNotNone(event_id)
+        assert event_id is not None
 
-    @patch('world_dynamics.apply_event_effects')
-    def test_apply_event_effects_exception(self, mock_apply):
+    @patch('chaos_pack.world_dynamics.apply_event_effects')
+    def test_apply_event_effects_exception(self, mock_apply, caplog):
         mock_apply.side_effect = Exception("Test exception")
-        with self.assertLogs(level='ERROR') as log:
-            event_id = wd.inject_chaotic_event(manual_event="trade_freeze")
-            self.assertIsNone(event_id)
-            self.assertTrue(
-                any("Error applying event effects" in message for message in log.output))
+        event_id = wd.inject_chaotic_event(manual_event="trade_freeze")
+        assert event_id is None
+        assert any("Error applying event effects" in r.message for r in caplog.records)
         # Engine should be disabled after exception
-        self.assertFalse(wd._black_swan_enabled)
+        assert not wd._black_swan_enabled
 
 
-if __name__ == "__main__":
-    unittest.main()
+@pytest.mark.parametrize(("event", "agents", "difficulty"), [
+    ("trade_freeze", ("agent_1", "agent_3", "agent_7"), 7.5),
+    ("symbolic_agent_death", ("agent_9",), 6.5),
+    ("unknown_event", (), 5.0),
+])
+def test_event_tables(event, agents, difficulty):
+    assert wd.determine_affected_agents(event) == agents
+    assert wd.calculate_detection_difficulty(event) == difficulty
@@ -0,0 +1,125 @@
+import json
+from collections import OrderedDict
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+
+import x402_demo_server as server
+
+MOCK_SIGNATURE = "0xmocksig_demo"
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    # Mutable fake clock; only the server module's view of time is patched
+    now = [1_000.0]
+    monkeypatch.setattr(server, "time", SimpleNamespace(time=lambda: now[0]))
+    return now
+
+
+@pytest.fixture
+def client(monkeypatch, clock):
+    monkeypatch.setattr(server, "payment_records", OrderedDict())
+    monkeypatch.setattr(server, "payments_processed", 0)
+    return TestClient(server.app)
+
+
+def pay(client, payment_id, signature=MOCK_SIGNATURE):
+    header = json.dumps({"paymentId": payment_id, "signature": signature, "amount": "0.10"})
+    return client.get("/api/premium-data", headers={"X-PAYMENT": header})
+
+
+def test_verified_payment_is_recorded(client, clock):
+    assert pay(client, "p1").status_code == 200
+    status = client.get("/api/payment-status/p1").json()
+    assert status == {"payment_id": "p1", "status": "verified", "verified_at": clock[0]}
+    assert client.get("/api/payment-status/unknown").status_code == 404
+
+
+def test_expired_payment_returns_404(client, clock):
+    pay(client, "p1")
+    clock[0] += server.PAYMENT_RECORD_TTL_SECONDS - 1
+    assert client.get("/api/payment-status/p1").status_code == 200
+    clock[0] += 2
+    assert client.get("/api/payment-status/p1").status_code == 404
+    assert "p1" not in server.payment_records
+
+
+def test_capacity_cap_evicts_oldest(client, monkeypatch, clock):
+    monkeypatch.setattr(server, "PAYMENT_RECORD_MAX_ENTRIES", 2)
+    for payment_id in ("p1", "p2", "p3"):
+        pay(client, payment_id)
+        clock[0] += 1
+    assert list(server.payment_records) == ["p2", "p3"]
+    assert client.get("/api/payment-status/p1").status_code == 404
+
+
+def test_reverified_payment_moves_to_end(client, monkeypatch, clock):
+    monkeypatch.setattr(server, "PAYMENT_RECORD_MAX_ENTRIES", 2)
+    pay(client, "p1")
+    pay(client, "p2")
+    clock[0] += 1
+    pay(client, "p1")
+    assert list(server.payment_records) == ["p2", "p1"]
+    assert server.payment_records["p1"]["verified_at"] == clock[0]
+    # The stale p2 is now the one evicted
+    pay(client, "p3")
+    assert list(server.payment_records) == ["p1", "p3"]
+
+
+def test_health_reports_processed_and_active(client, monkeypatch, clock):
+    monkeypatch.setattr(server, "PAYMENT_RECORD_MAX_ENTRIES", 1)
+    pay(client, "p1")
+    pay(client, "p2")
+    assert pay(client, "p3", signature="short").status_code != 200
+    health = client.get("/health").json()
+    assert health["payments_processed"] == 2
+    assert health["payments_active"] == 1
+
+
+def test_payment_required_body_matches_json_payload(client, clock):
+    clock[0] = 1_700_000_000.123456
+    response = client.get("/api/premium-data")
+    assert response.status_code == 402
+    assert response.headers["content-type"] == "application/json"
+    body = response.json()
+    assert list(body) == ["status", "maxAmountRequired", "assetAddress", "paymentAddress",
+                          "network", "paymentId", "timestamp", "message"]
+    assert body == {
+        "status": "payment_required",
+        "maxAmountRequired": server.DEMO_CONFIG["premium_resource_cost"],
+        "assetAddress": server.DEMO_CONFIG["usdc_address"],
+        "paymentAddress": server.DEMO_CONFIG["payment_address"],
+        "network": server.DEMO_CONFIG["network"],
+        "paymentId": body["paymentId"],
+        "timestamp": clock[0],
+        "message": "Payment required to access premium data",
+    }
+    # Two requests get distinct payment IDs
+    assert client.get("/api/premium-data").json()["paymentId"] != body["paymentId"]
+
+
+@pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "stdlib"])
+def test_json_helpers(monkeypatch, use_orjson):
+    if use_orjson:
+        pytest.importorskip("orjson")
+    monkeypatch.setattr(server, "ORJSON_AVAILABLE", use_orjson)
+    assert server._json_loads('{"paymentId": "p1", "amount": 0.1}') == {"paymentId": "p1", "amount": 0.1}
+    with pytest.raises(json.JSONDecodeError):
+        server._json_loads("{not json")
+    response = server._json_response({"status": "success", "values": [1, 2.5, None, "é"]})
+    assert response.media_type == "application/json"
+    assert json.loads(response.body) == {"status": "success", "values": [1, 2.5, None, "é"]}
+
+
+@pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "stdlib"])
+def test_premium_data_round_trip(client, monkeypatch, clock, use_orjson):
+    if use_orjson:
+        pytest.importorskip("orjson")
+    monkeypatch.setattr(server, "ORJSON_AVAILABLE", use_orjson)
+    body = pay(client, "p1").json()
+    assert body["status"] == "success"
+    assert body["payment_confirmed"] == {"payment_id": "p1", "amount": "0.10", "verified_at": clock[0]}
+    response = client.get("/api/premium-data", headers={"X-PAYMENT": "{not json"})
+    assert response.status_code == 400
@@ -0,0 +1,43 @@
+"""
+Numba-compiled kernels for batched trade scoring.
+
+Importing this module requires NumPy and Numba and triggers JIT setup, so
+callers import it lazily on first use and fall back to the pure-Python
+scoring path when the import fails.
+"""
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def score_batch(offer_ids, offer_offsets, receiver_ids, receiver_offsets, tag_weight):
+    """
+    Score a batch of proposals by counting shared tag IDs.
+
+    Proposal k uses offer_ids[offer_offsets[k]:offer_offsets[k + 1]] and
+    receiver_ids[receiver_offsets[k]:receiver_offsets[k + 1]]. Both slices
+    must be sorted and free of duplicates; matches are counted with a
+    two-pointer merge.
+
+    :return: float64 array with tag_weight * matches for each proposal.
+    """
+    n = offer_offsets.shape[0] - 1
+    scores = np.zeros(n, dtype=np.float64)
+    for k in range(n):
+        i = offer_offsets[k]
+        i_end = offer_offsets[k + 1]
+        j = receiver_offsets[k]
+        j_end = receiver_offsets[k + 1]
+        matches = 0
+        while i < i_end and j < j_end:
+            if offer_ids[i] == receiver_ids[j]:
+                matches += 1
+                i += 1
+                j += 1
+            elif offer_ids[i] < receiver_ids[j]:
+                i += 1
+            else:
+                j += 1
+        scores[k] = tag_weight * matches
+    return scores
@@ -1,7 +1,49 @@
-from typing import Dict
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Iterable, List, Tuple
 from agents.agent import Agent
 from trading.trading_logic import TradeEvaluator
 
+TAG_MATCH_WEIGHT = 0.3
+ACCEPT_THRESHOLD = 0.2
+
+
+@lru_cache(maxsize=None)
+def _score_batch_kernel():
+    """
+    Import the Numba scoring kernel on first use; None if NumPy or Numba is unavailable.
+    Deferred so that importing this module does not pull in Numba.
+    """
+    try:
+        from trading._kernels import score_batch
+    except ImportError:
+        return None
+    return score_batch
+
+
+def _receiver_tag_set(receiver) -> FrozenSet[str]:
+    """
+    Build the receiver's tag set from its current tags on every call, so that
+    reassigned and in-place edited tag lists are both scored.
+    Prefers the Agent.tags attribute and falls back to capsule_data["tags"].
+    """
+    receiver_tags = getattr(receiver, "tags", None)
+    if receiver_tags is None:
+        receiver_tags = receiver.capsule_data.get("tags")
+    return frozenset(receiver_tags or ())
+
+
+def _encode_tags(tags: FrozenSet[str], tag_ids: Dict[str, int],
+                 cache: Dict[FrozenSet[str], List[int]]) -> List[int]:
+    """
+    Map a tag set to its sorted list of integer tag IDs.
+    The vocabulary and cache are scoped to one batch so that nothing outlives the call.
+    """
+    ids = cache.get(tags)
+    if ids is None:
+        ids = sorted(tag_ids.setdefault(tag, len(tag_ids)) for tag in tags)
+        cache[tags] = ids
+    return ids
+
 
 def propose_trade(sender, receiver, offer):
     """
@@ -19,19 +61,56 @@ def propose_trade(sender, receiver, offer):
     # and would involve evaluating the alignment with the agent's goals and values
 
     # Calculate a simple score based on tag matching
-    score = 0.0
-    receiver_tags = receiver.capsule_data.get("tags", [])
-    receiver_values = receiver.capsule_data.get("values", [])
-
-    for tag in offer.get("item_tags", []):
-        if tag in receiver_tags:
-            score += 0.3
+    receiver_tags = _receiver_tag_set(receiver)
+    score = TAG_MATCH_WEIGHT * len(receiver_tags.intersection(offer.get("item_tags", [])))
 
     # Simple decision: accept if score is above threshold
-    accepted = score > 0.2
+    accepted = score > ACCEPT_THRESHOLD
 
     return {
         "accepted": accepted,
         "score": score,
         "proposal": offer
     }
+
+
+def propose_trades(proposals: Iterable[Tuple[Any, Any, Dict]]) -> List[Dict]:
+    """
+    Evaluate a batch of trade proposals in one call.
+
+    When Numba is available, tags are encoded as integer IDs and every
+    proposal is scored by a single compiled kernel call; otherwise each
+    proposal goes through propose_trade.
+
+    Args:
+        proposals: Iterable of (sender, receiver, offer) tuples
+
+    Returns:
+        list: One propose_trade-style result dict per proposal, in order
+    """
+    proposals = list(proposals)
+    score_batch = _score_batch_kernel()
+    if score_batch is None:
+        return [propose_trade(sender, receiver, offer) for sender, receiver, offer in proposals]
+    import numpy as np
+
+    tag_ids: Dict[str, int] = {}
+    cache: Dict[FrozenSet[str], List[int]] = {}
+    offer_ids: List[int] = []
+    offer_offsets = [0]
+    receiver_ids: List[int] = []
+    receiver_offsets = [0]
+    for _, receiver, offer in proposals:
+        offer_ids.extend(_encode_tags(frozenset(offer.get("item_tags", [])), tag_ids, cache))
+        offer_offsets.append(len(offer_ids))
+        receiver_ids.extend(_encode_tags(_receiver_tag_set(receiver), tag_ids, cache))
+        receiver_offsets.append(len(receiver_ids))
+
+    scores = score_batch(
+        np.asarray(offer_ids, dtype=np.int32), np.asarray(offer_offsets, dtype=np.int64),
+        np.asarray(receiver_ids, dtype=np.int32), np.asarray(receiver_offsets, dtype=np.int64),
+        TAG_MATCH_WEIGHT)
+    return [
+        {"accepted": bool(score > ACCEPT_THRESHOLD), "score": float(score), "proposal": offer}
+        for (_, _, offer), score in zip(proposals, scores)
+    ]
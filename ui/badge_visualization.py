@@ -1,4 +1,5 @@
-from typing import List
+from functools import lru_cache
+from typing import List, Tuple
 from registry.capsule_registry import Capsule
 
 
@@ -17,11 +18,20 @@ class BadgeVisualization:
         """
         if not badges:
             return "No badges earned yet."
-        badge_names = [badge.values.get(
-            "badge_name", "Unnamed Badge") for badge in badges]
+        badge_names = tuple(badge.values.get(
+            "badge_name", "Unnamed Badge") for badge in badges)
+        return BadgeVisualization._render_badge_names(badge_names)
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _render_badge_names(badge_names: Tuple[str, ...]) -> str:
+        """
+        Join badge names for display; cached since the same collections are re-rendered on each refresh.
+        """
         return "Badges: " + ", ".join(badge_names)
 
     @staticmethod
+    @lru_cache(maxsize=1024)
     def render_xp(xp: int) -> str:
         """
         Render a textual placeholder for XP display.
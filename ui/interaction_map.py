@@ -1,6 +1,125 @@
-from typing import List, Dict, Optional
+import json
+import sys
+from bisect import bisect_left, bisect_right
+from typing import Any, List, Dict, Optional, Union
 from datetime import datetime
-from collections import defaultdict
+from enum import IntEnum
+from collections import Counter, defaultdict
+from xml.sax.saxutils import XMLGenerator
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+GRAPHML_NAMESPACE = "http://graphml.graphdrawing.org/xmlns"
+
+# <key> declarations for every <data> field the GraphML export writes: (id, for, attr.type)
+GRAPHML_KEYS = (
+    ("type", "node", "string"),
+    ("interaction_type", "edge", "string"),
+    ("weight", "edge", "int"),
+)
+
+
+class InteractionType(IntEnum):
+    """
+    Codes for the built-in interaction types.
+    """
+    TRADE = 0
+    QUERY = 1
+    VISIBILITY_SHARE = 2
+    COALITION_MEMBERSHIP = 3
+
+
+# Canonical name for each code; records store these shared strings so exports stay readable
+INTERACTION_TYPE_NAMES = {
+    InteractionType.TRADE: "trade",
+    InteractionType.QUERY: "query",
+    InteractionType.VISIBILITY_SHARE: "visibility_share",
+    InteractionType.COALITION_MEMBERSHIP: "coalition_membership",
+}
+
+
+def _json_default(obj: Any) -> str:
+    """
+    Serialize datetimes the same way orjson does for the stdlib json fallback.
+    """
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _write_graphml_element(writer: XMLGenerator, name: str, attrs: Dict[str, str], data: Dict[str, str]) -> None:
+    """
+    Write a GraphML node or edge element with one <data> child per entry in data.
+    """
+    writer.startElement(name, attrs)
+    for key, text in data.items():
+        writer.startElement("data", {"key": key})
+        writer.characters(text)
+        writer.endElement("data")
+    writer.endElement(name)
+
+
+class _Snapshot(dict):
+    """
+    Snapshot of an InteractionMap at a given step, as a plain dict to callers.
+    Interactions are append-only, so the snapshot keeps an end index into the
+    shared interaction log and slices it into the dict once, on first access.
+    Serializers that read dict storage directly (orjson) need dict(snapshot) for an unread snapshot.
+    """
+    __slots__ = ("_log", "interactions_end")
+
+    def __init__(self, step: int, coalitions: Dict[int, List[str]], interactions: List[Dict], interactions_end: int):
+        super().__init__(step=step, coalitions=coalitions)
+        self._log: Optional[List[Dict]] = interactions
+        self.interactions_end = interactions_end
+
+    def _materialize(self) -> None:
+        """
+        Slice the interaction log into the dict if that has not happened yet.
+        """
+        if self._log is not None:
+            log, self._log = self._log, None
+            dict.__setitem__(self, "interactions", log[:self.interactions_end])
+
+    def __reduce_ex__(self, protocol):
+        # Copies and pickles are plain dicts
+        return dict, (self._to_dict(),)
+
+    def _to_dict(self) -> Dict:
+        """
+        Plain dict copy for serialization; an unread snapshot does not keep the slice.
+        """
+        if self._log is None:
+            return dict(self)
+        data = dict(dict.items(self))
+        data["interactions"] = self._log[:self.interactions_end]
+        return data
+
+
+def _materializing(name: str):
+    """
+    Wrap a dict method so that it slices a _Snapshot's interactions in before running.
+    """
+    method = getattr(dict, name)
+
+    def wrapper(self, *args, **kwargs):
+        self._materialize()
+        return method(self, *args, **kwargs)
+
+    wrapper.__name__ = name
+    return wrapper
+
+
+# Every dict operation that reads or changes the contents slices the log in first
+for _name in ("__getitem__", "__setitem__", "__delitem__", "__iter__", "__len__", "__contains__",
+              "__eq__", "__ne__", "__repr__", "keys", "items", "values", "get",
+              "copy", "pop", "popitem", "setdefault", "update", "clear"):
+    setattr(_Snapshot, _name, _materializing(_name))
+del _name
 
 
 class InteractionMap:
@@ -12,16 +131,31 @@ class InteractionMap:
         self.interactions: List[Dict] = []
         self.coalition_memberships: Dict[int, List[str]] = {}
         self.snapshots: List[Dict] = []
+        # Per-agent index in timestamp order, sharing the same interaction dicts as self.interactions
+        self._by_agent: Dict[str, List[Dict]] = defaultdict(list)
+        # Timestamps parallel to each _by_agent list, for bisecting time windows
+        self._agent_timestamps: Dict[str, List[datetime]] = defaultdict(list)
+        # Adjacency maintained incrementally as interactions are recorded
+        self._links: Dict[str, set] = defaultdict(set)
+        # Running per-agent interaction counts by type
+        self._type_counts: Dict[str, Counter] = defaultdict(Counter)
+        # Every agent seen in an interaction or coalition, in first-seen order
+        self._agent_ids: Dict[str, None] = {}
 
-    def record_interaction(self, agent_a: str, agent_b: str, interaction_type: str, timestamp: Optional[datetime] = None) -> None:
+    def record_interaction(self, agent_a: str, agent_b: str, interaction_type: Union[str, InteractionType], timestamp: Optional[datetime] = None) -> None:
         """
         Record an interaction between two agents.
 
         :param agent_a: ID of the first agent.
         :param agent_b: ID of the second agent.
-        :param interaction_type: Type of interaction (e.g., trade, query, visibility_share).
+        :param interaction_type: Type of interaction (e.g., trade, query, visibility_share), as a name or InteractionType code.
         :param timestamp: Optional timestamp; defaults to current time if None.
         """
+        # Interned IDs make the index lookups below hit the identity fast path
+        agent_a = sys.intern(agent_a)
+        agent_b = sys.intern(agent_b)
+        if isinstance(interaction_type, int):
+            interaction_type = INTERACTION_TYPE_NAMES[interaction_type]
         if timestamp is None:
             timestamp = datetime.utcnow()
         interaction = {
@@ -31,82 +165,120 @@ class InteractionMap:
             "timestamp": timestamp,
         }
         self.interactions.append(interaction)
+        self._agent_ids[agent_a] = None
+        self._agent_ids[agent_b] = None
+        self._index_interaction(agent_a, interaction)
+        if agent_b != agent_a:
+            self._index_interaction(agent_b, interaction)
+        self._links[agent_a].add(agent_b)
+        self._links[agent_b].add(agent_a)
+
+    def _index_interaction(self, agent_id: str, interaction: Dict) -> None:
+        """
+        Add an interaction to one agent's index, timestamps and type counts.
+        A backdated interaction is inserted at its timestamp position, after any
+        equal timestamps, so the index stays in order without later sorting.
+        """
+        timestamp = interaction["timestamp"]
+        timestamps = self._agent_timestamps[agent_id]
+        agent_interactions = self._by_agent[agent_id]
+        if timestamps and timestamp < timestamps[-1]:
+            index = bisect_right(timestamps, timestamp)
+            timestamps.insert(index, timestamp)
+            agent_interactions.insert(index, interaction)
+        else:
+            timestamps.append(timestamp)
+            agent_interactions.append(interaction)
+        self._type_counts[agent_id][interaction["interaction_type"]] += 1
 
     def record_coalition_membership(self, coalition_id: int, members: List[str]) -> None:
         """
         Record the membership of a coalition at a given step.
         """
+        members = [sys.intern(member) for member in members]
         self.coalition_memberships[coalition_id] = members
+        self._agent_ids.update(dict.fromkeys(members))
 
     def export_snapshot(self, step: int) -> Dict:
         """
         Export a snapshot of the interaction map including coalitions and pairwise interactions.
+        The snapshot records an end marker into the interaction log and copies the
+        interactions only when it is first read.
         """
-        snapshot = {
-            "step": step,
-            "coalitions": self.coalition_memberships.copy(),
-            "interactions": self.interactions.copy(),
-        }
+        snapshot = _Snapshot(step, dict(self.coalition_memberships),
+                             self.interactions, len(self.interactions))
         self.snapshots.append(snapshot)
         return snapshot
 
     def export_json(self, filepath: str) -> None:
         """
         Export all snapshots to a JSON file.
+        Snapshots are converted and written one at a time, using orjson when available.
         """
-        import json
-        with open(filepath, "w") as f:
-            json.dump(self.snapshots, f, indent=2)
+        with open(filepath, "wb") as f:
+            f.write(b"[")
+            for index, snapshot in enumerate(self.snapshots):
+                f.write(b",\n" if index else b"\n")
+                if ORJSON_AVAILABLE:
+                    f.write(orjson.dumps(
+                        snapshot._to_dict(), option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+                else:
+                    f.write(json.dumps(snapshot._to_dict(), indent=2,
+                            default=_json_default).encode("utf-8"))
+            f.write(b"\n]" if self.snapshots else b"]")
 
     def export_graphml(self, filepath: str) -> None:
         """
         Export the interaction map as a GraphML file compatible with Gephi or Cytoscape.
         Includes both pairwise interactions and coalition nodes.
+        Repeated interactions of one type between the same pair collapse into one edge
+        whose weight is the number of interactions; all data fields are declared as <key>s.
+        The document is streamed to disk rather than built in memory first.
         """
-        import xml.etree.ElementTree as ET
-
-        graphml = ET.Element(
-            "graphml", xmlns="http://graphml.graphdrawing.org/xmlns")
-        graph = ET.SubElement(graphml, "graph", edgedefault="undirected")
-
-        # Add nodes for agents
-        agents = set()
-        for interaction in self.interactions:
-            agents.add(interaction["agent_a"])
-            agents.add(interaction["agent_b"])
-        for coalition_id, members in self.coalition_memberships.items():
-            coalition_node_id = f"coalition_{coalition_id}"
-            node = ET.SubElement(graph, "node", id=coalition_node_id)
-            data = ET.SubElement(node, "data", key="type")
-            data.text = "coalition"
-            for member in members:
-                agents.add(member)
-        for agent in agents:
-            node = ET.SubElement(graph, "node", id=agent)
-            data = ET.SubElement(node, "data", key="type")
-            data.text = "agent"
-
-        # Add edges for pairwise interactions
-        edge_id = 0
-        for interaction in self.interactions:
-            edge = ET.SubElement(
-                graph, "edge", id=f"e{edge_id}", source=interaction["agent_a"], target=interaction["agent_b"])
-            data = ET.SubElement(edge, "data", key="interaction_type")
-            data.text = interaction["interaction_type"]
-            edge_id += 1
-
-        # Add edges from coalition nodes to members
-        for coalition_id, members in self.coalition_memberships.items():
-            coalition_node_id = f"coalition_{coalition_id}"
-            for member in members:
-                edge = ET.SubElement(
-                    graph, "edge", id=f"e{edge_id}", source=coalition_node_id, target=member)
-                data = ET.SubElement(edge, "data", key="interaction_type")
-                data.text = "coalition_membership"
+        with open(filepath, "wb") as f:
+            writer = XMLGenerator(f, encoding="utf-8")
+            writer.startDocument()
+            writer.startElement("graphml", {"xmlns": GRAPHML_NAMESPACE})
+            for key_id, domain, attr_type in GRAPHML_KEYS:
+                writer.startElement("key", {"id": key_id, "for": domain,
+                                            "attr.name": key_id, "attr.type": attr_type})
+                writer.endElement("key")
+            writer.startElement("graph", {"edgedefault": "undirected"})
+
+            # Add nodes for coalitions and agents
+            for coalition_id in self.coalition_memberships:
+                _write_graphml_element(
+                    writer, "node", {"id": f"coalition_{coalition_id}"}, {"type": "coalition"})
+            for agent in self._agent_ids:
+                _write_graphml_element(
+                    writer, "node", {"id": agent}, {"type": "agent"})
+
+            # Add one weighted edge per unique (agent pair, interaction type);
+            # the graph is undirected so pairs are stored in sorted order
+            edge_counts = Counter(
+                (min(i["agent_a"], i["agent_b"]), max(i["agent_a"], i["agent_b"]), i["interaction_type"])
+                for i in self.interactions)
+            edge_id = 0
+            for (source, target, interaction_type), weight in edge_counts.items():
+                _write_graphml_element(
+                    writer, "edge",
+                    {"id": f"e{edge_id}", "source": source, "target": target},
+                    {"interaction_type": interaction_type, "weight": str(weight)})
                 edge_id += 1
 
-        tree = ET.ElementTree(graphml)
-        tree.write(filepath, encoding="utf-8", xml_declaration=True)
+            # Add edges from coalition nodes to members
+            for coalition_id, members in self.coalition_memberships.items():
+                coalition_node_id = f"coalition_{coalition_id}"
+                for member in members:
+                    _write_graphml_element(
+                        writer, "edge",
+                        {"id": f"e{edge_id}", "source": coalition_node_id, "target": member},
+                        {"interaction_type": INTERACTION_TYPE_NAMES[InteractionType.COALITION_MEMBERSHIP]})
+                    edge_id += 1
+
+            writer.endElement("graph")
+            writer.endElement("graphml")
+            writer.endDocument()
 
     def get_interactions(self, agent_id: str, limit: int = 50) -> List[Dict]:
         """
@@ -116,26 +288,32 @@ class InteractionMap:
         :param limit: Maximum number of interactions to return.
         :return: List of interaction records.
         """
-        filtered = [i for i in self.interactions if i["agent_a"]
-                    == agent_id or i["agent_b"] == agent_id]
-        sorted_interactions = sorted(
-            filtered, key=lambda i: i["timestamp"], reverse=True)
-        return sorted_interactions[:limit]
+        agent_interactions = self._by_agent.get(agent_id, [])
+        if limit > 0:
+            # The index is in timestamp order; newest are at the end
+            return agent_interactions[-limit:][::-1]
+        return agent_interactions[::-1][:limit]
+
+    def get_interactions_since(self, agent_id: str, since: datetime) -> List[Dict]:
+        """
+        Retrieve interactions involving the specified agent at or after a given time.
+
+        :param agent_id: Agent ID to filter interactions.
+        :param since: Earliest timestamp to include.
+        :return: List of interaction records, newest first.
+        """
+        start = bisect_left(self._agent_timestamps.get(agent_id, []), since)
+        return self._by_agent.get(agent_id, [])[start:][::-1]
 
     def get_relationship_links(self) -> Dict[str, List[str]]:
         """
         Summarize relationship links between agents.
+        Built from the adjacency kept on record, so no interactions are scanned here;
+        each call returns new lists that callers may change freely.
 
         :return: Dictionary mapping agent_id to list of connected agent_ids.
         """
-        links = defaultdict(set)
-        for interaction in self.interactions:
-            a = interaction["agent_a"]
-            b = interaction["agent_b"]
-            links[a].add(b)
-            links[b].add(a)
-        # Convert sets to lists
-        return {agent: list(neighbors) for agent, neighbors in links.items()}
+        return {agent: list(neighbors) for agent, neighbors in self._links.items()}
 
     def summarize_interactions(self, agent_id: str) -> Dict:
         """
@@ -144,16 +322,8 @@ class InteractionMap:
         :param agent_id: Agent ID to summarize.
         :return: Dictionary summarizing interaction counts by type and connected agents.
         """
-        summary = {
-            "interaction_counts": {},
-            "connected_agents": set(),
+        # Both parts are maintained on record, so no interactions are scanned here
+        return {
+            "interaction_counts": dict(self._type_counts.get(agent_id, {})),
+            "connected_agents": list(self._links.get(agent_id, ())),
         }
-        for interaction in self.interactions:
-            if interaction["agent_a"] == agent_id or interaction["agent_b"] == agent_id:
-                itype = interaction["interaction_type"]
-                summary["interaction_counts"][itype] = summary["interaction_counts"].get(
-                    itype, 0) + 1
-                other_agent = interaction["agent_b"] if interaction["agent_a"] == agent_id else interaction["agent_a"]
-                summary["connected_agents"].add(other_agent)
-        summary["connected_agents"] = list(summary["connected_agents"])
-        return summary
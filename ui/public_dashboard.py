@@ -1,19 +1,76 @@
-from typing import Dict, Any, Optional
+import time
+from functools import wraps
+from typing import Callable, Dict, Any, Optional, Tuple
 from ui.social_feed import SocialFeed
 from ui.interaction_map import InteractionMap
 from ui.snapshot_panel import SnapshotPanel
 
 
+def _copy_response(response: Any) -> Any:
+    """
+    Copy a cached response's dicts, lists and tuples all the way down, so one caller
+    editing any part of its response cannot change what later callers receive.
+    Leaf values (strings, numbers, datetimes) are immutable and shared.
+    """
+    if isinstance(response, dict):
+        return {key: _copy_response(value) for key, value in response.items()}
+    if isinstance(response, list):
+        return [_copy_response(value) for value in response]
+    if isinstance(response, tuple):
+        return tuple(_copy_response(value) for value in response)
+    return response
+
+
+def _cached_endpoint(method: Callable) -> Callable:
+    """
+    Cache an endpoint's response per (endpoint, args, kwargs) for the dashboard's cache_ttl.
+    Identical requests within the TTL window share one computation; each caller gets its own copy.
+    """
+    name = method.__name__
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self.cache_ttl <= 0:
+            return method(self, *args, **kwargs)
+        key = (name, args, tuple(sorted(kwargs.items())))
+        now = time.monotonic()
+        cached = self._cache.get(key)
+        if cached is not None and cached[0] > now:
+            return _copy_response(cached[1])
+        result = method(self, *args, **kwargs)
+        if key not in self._cache and len(self._cache) >= self.cache_maxsize:
+            # Drop expired entries first, then the oldest if still full
+            self._cache = {k: v for k, v in self._cache.items() if v[0] > now}
+            if len(self._cache) >= self.cache_maxsize:
+                del self._cache[next(iter(self._cache))]
+        self._cache[key] = (now + self.cache_ttl, result)
+        return _copy_response(result)
+
+    return wrapper
+
+
 class PublicDashboard:
     """
     Backend interface exposing API endpoints for public data access.
+    Identical requests within cache_ttl seconds (default 1.0) get the cached response,
+    so writes made meanwhile are not visible until it expires.
     """
 
-    def __init__(self, social_feed: SocialFeed, interaction_map: InteractionMap, snapshot_panel: SnapshotPanel):
+    def __init__(self, social_feed: SocialFeed, interaction_map: InteractionMap, snapshot_panel: SnapshotPanel,
+                 cache_ttl: float = 1.0, cache_maxsize: int = 1024):
+        """
+        :param cache_ttl: Seconds an endpoint response is reused for identical requests; 0 disables caching.
+        :param cache_maxsize: Maximum number of cached responses.
+        """
         self.social_feed = social_feed
         self.interaction_map = interaction_map
         self.snapshot_panel = snapshot_panel
+        self.cache_ttl = cache_ttl
+        self.cache_maxsize = cache_maxsize
+        # Maps (endpoint, args, kwargs) to (expiry time, response)
+        self._cache: Dict[Tuple, Tuple[float, Any]] = {}
 
+    @_cached_endpoint
     def get_snapshot(self, agent_id: str) -> Dict[str, Any]:
         """
         API endpoint to get agent snapshot data.
@@ -23,6 +80,7 @@ class PublicDashboard:
         """
         return self.snapshot_panel.get_agent_snapshot(agent_id)
 
+    @_cached_endpoint
     def get_feed(self, agent_id: Optional[str] = None, limit: int = 50) -> Dict[str, Any]:
         """
         API endpoint to get social feed entries.
@@ -37,6 +95,7 @@ class PublicDashboard:
             entries = self.social_feed.get_recent_entries(limit)
         return {"entries": entries}
 
+    @_cached_endpoint
     def get_interaction_map(self, agent_id: Optional[str] = None, limit: int = 50) -> Dict[str, Any]:
         """
         API endpoint to get interaction map data.
@@ -1,5 +1,21 @@
 from typing import Dict, Any, Optional, List
 
+# Shared attribute names and their defaults when the agent lacks them
+_SHARED_ATTRIBUTE_DEFAULTS = (
+    ("goal", None),
+    ("values", None),
+    ("wallet_address", None),
+    ("nft_assigned", False),
+)
+
+
+def _shared_attributes(agent: Any) -> Dict[str, Any]:
+    """
+    Collect the shared attributes of an agent in a single pass.
+    Uses getattr rather than the instance __dict__ since some fields are properties.
+    """
+    return {name: getattr(agent, name, default) for name, default in _SHARED_ATTRIBUTE_DEFAULTS}
+
 
 class SnapshotPanel:
     """
@@ -19,6 +35,19 @@ class SnapshotPanel:
         self.visibility_preferences = visibility_preferences
         self.agent_registry = agent_registry or {}
 
+    @property
+    def visibility_preferences(self) -> Any:
+        return self._visibility_preferences
+
+    @visibility_preferences.setter
+    def visibility_preferences(self, visibility_preferences: Any) -> None:
+        # Resolve the optional manager capabilities once rather than probing with hasattr per call
+        self._visibility_preferences = visibility_preferences
+        self._get_prefs = getattr(visibility_preferences, "get_preferences", None)
+        self._view_prefs = getattr(visibility_preferences, "view_preferences", None)
+        self._update_pref = getattr(visibility_preferences, "update_preference", None)
+        self._get_agent_prefs = getattr(visibility_preferences, "get_agent_preferences", None)
+
     def get_public_snippet(self) -> Optional[str]:
         """
         Query the agent's public snippet.
@@ -55,12 +84,7 @@ class SnapshotPanel:
 
         :return: Dictionary of shared attributes.
         """
-        return {
-            "goal": getattr(self.agent, "goal", None),
-            "values": getattr(self.agent, "values", None),
-            "wallet_address": getattr(self.agent, "wallet_address", None),
-            "nft_assigned": getattr(self.agent, "nft_assigned", False),
-        }
+        return _shared_attributes(self.agent)
 
     def get_visibility_preferences(self) -> Dict[str, bool]:
         """
@@ -68,9 +92,7 @@ class SnapshotPanel:
 
         :return: Dictionary of category to boolean preference.
         """
-        if hasattr(self.visibility_preferences, "get_preferences"):
-            return self.visibility_preferences.get_preferences()
-        return {}
+        return self._get_prefs() if self._get_prefs else {}
 
     def toggle_visibility_preference(self, category: str) -> None:
         """
@@ -78,11 +100,11 @@ class SnapshotPanel:
 
         :param category: The category to toggle.
         """
-        current_prefs = self.get_visibility_preferences()
+        # Read through the manager's read-only view when it has one, avoiding a copy
+        current_prefs = self._view_prefs() if self._view_prefs else self.get_visibility_preferences()
         current_value = current_prefs.get(category, False)
-        if hasattr(self.visibility_preferences, "update_preference"):
-            self.visibility_preferences.update_preference(
-                category, not current_value)
+        if self._update_pref:
+            self._update_pref(category, not current_value)
 
     def get_agent_snapshot(self, agent_id: str) -> Dict:
         """
@@ -95,16 +117,20 @@ class SnapshotPanel:
         if not agent:
             return {}
 
+        # Agents that build their own snapshot in one call; looked up on the class so
+        # a duck-typed agent's __getattr__ (e.g. a MagicMock) cannot take this path
+        snapshot_view = getattr(type(agent), "snapshot_view", None)
+        if snapshot_view is not None:
+            view = snapshot_view(agent)
+            if isinstance(view, dict):
+                return view
+
+        tags = getattr(agent, "tags", None)
         snapshot = {
             "public_snippet": getattr(agent, "public_snippet", None),
-            "top_badge": getattr(agent, "tags", [None])[0] if getattr(agent, "tags", None) else None,
+            "top_badge": tags[0] if tags else None,
             "current_mood": "neutral",  # Placeholder
-            "shared_attributes": {
-                "goal": getattr(agent, "goal", None),
-                "values": getattr(agent, "values", None),
-                "wallet_address": getattr(agent, "wallet_address", None),
-                "nft_assigned": getattr(agent, "nft_assigned", False),
-            }
+            "shared_attributes": _shared_attributes(agent),
         }
         return snapshot
 
@@ -116,8 +142,8 @@ class SnapshotPanel:
         :return: Dictionary of visibility preferences.
         """
         # For demonstration, assume visibility preferences are global or per agent in a dict
-        if hasattr(self.visibility_preferences, "get_agent_preferences"):
-            return self.visibility_preferences.get_agent_preferences(agent_id)
+        if self._get_agent_prefs:
+            return self._get_agent_prefs(agent_id)
         # Fallback to global preferences
         return self.get_visibility_preferences()
 
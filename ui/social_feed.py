@@ -1,72 +1,218 @@
-from typing import List, Dict, Optional
-from datetime import datetime
+import time
+from bisect import bisect_right
+from collections import defaultdict
+from itertools import islice
+from typing import Any, Iterable, Iterator, List, Dict, Optional, Tuple, Union
+from datetime import datetime, timezone
+
+Timestamp = Union[datetime, float]
+
+
+def _to_epoch(timestamp: Optional[Timestamp]) -> float:
+    """
+    Convert a timestamp to float epoch seconds; None means now.
+    Naive datetimes are taken as UTC, matching datetime.utcnow().
+    """
+    if timestamp is None:
+        return time.time()
+    if isinstance(timestamp, datetime):
+        if timestamp.tzinfo is None:
+            timestamp = timestamp.replace(tzinfo=timezone.utc)
+        return timestamp.timestamp()
+    return float(timestamp)
+
+
+def timestamp_to_datetime(timestamp: float) -> datetime:
+    """
+    Convert a feed entry's epoch timestamp to a naive UTC datetime for display.
+
+    :param timestamp: Epoch seconds as stored in a feed entry.
+    :return: Naive datetime in UTC.
+    """
+    return datetime.fromtimestamp(timestamp, timezone.utc).replace(tzinfo=None)
+
+
+class FeedEntry:
+    """
+    A single feed entry. Slotted so that large feeds stay compact in memory.
+    """
+
+    __slots__ = ("agent_id", "content", "type", "timestamp", "mood")
+
+    def __init__(self, agent_id: str, content: str, type: str, timestamp: float, mood: Optional[str] = None):
+        """
+        Initialize a FeedEntry instance.
+
+        :param agent_id: ID of the agent authoring the entry.
+        :param content: Content of the entry.
+        :param type: Entry type, one of SocialFeed.ENTRY_TYPES.
+        :param timestamp: Epoch seconds (UTC).
+        :param mood: Optional mood tag.
+        """
+        self.agent_id = agent_id
+        self.content = content
+        self.type = type
+        self.timestamp = timestamp
+        self.mood = mood
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Serialize the entry to a dictionary.
+
+        :return: Dictionary representation of the entry.
+        """
+        return {
+            "agent_id": self.agent_id,
+            "content": self.content,
+            "type": self.type,
+            "timestamp": self.timestamp,
+            "mood": self.mood,
+        }
+
+
+def _insert(entries: List[FeedEntry], timestamps: List[float], entry: FeedEntry) -> None:
+    """
+    Add an entry to a timestamp-ordered list and its parallel timestamp list.
+    A backdated entry is inserted after any equal timestamps, so ties keep append order.
+    """
+    timestamp = entry.timestamp
+    if timestamps and timestamp < timestamps[-1]:
+        index = bisect_right(timestamps, timestamp)
+        timestamps.insert(index, timestamp)
+        entries.insert(index, entry)
+    else:
+        timestamps.append(timestamp)
+        entries.append(entry)
 
 
 class SocialFeed:
     """
     Stores agent-authored public posts, event logs, and trade reflections.
+    Entry timestamps are stored as float epoch seconds (UTC).
     """
 
-    def __init__(self):
-        self.entries: List[Dict] = []
+    ENTRY_TYPES = ("post", "event_log", "trade_reflection")
+
+    def __init__(self, buffer_size: int = 128, flush_interval: float = 1.0):
+        """
+        Initialize the SocialFeed.
 
-    def append_post(self, agent_id: str, content: str, mood: Optional[str] = None, timestamp: Optional[datetime] = None) -> None:
+        :param buffer_size: Number of appended entries buffered before they are flushed
+                            into the feed; 1 disables buffering.
+        :param flush_interval: Seconds after which an append flushes the buffer regardless of size.
+        """
+        # Flushed entries in timestamp order; call flush() before reading this directly
+        self.entries: List[FeedEntry] = []
+        # Per-agent index in timestamp order, sharing the same entries as self.entries
+        self._by_agent: Dict[str, List[FeedEntry]] = defaultdict(list)
+        # Timestamps parallel to self.entries and each _by_agent list, for bisecting backdated entries
+        self._timestamps: List[float] = []
+        self._agent_timestamps: Dict[str, List[float]] = defaultdict(list)
+        self._buffer: List[FeedEntry] = []
+        self._buffer_size = buffer_size
+        self._flush_interval = flush_interval
+        self._last_flush = time.monotonic()
+
+    def _append(self, entry: FeedEntry) -> None:
+        """
+        Buffer an entry, flushing once the buffer is full or the flush interval has passed.
+        """
+        self._buffer.append(entry)
+        if len(self._buffer) >= self._buffer_size or time.monotonic() - self._last_flush > self._flush_interval:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Move buffered entries into the feed and the per-agent index.
+        Readers flush first, so appended entries are always visible to them.
+        """
+        self._last_flush = time.monotonic()
+        for entry in self._buffer:
+            _insert(self.entries, self._timestamps, entry)
+            _insert(self._by_agent[entry.agent_id], self._agent_timestamps[entry.agent_id], entry)
+        self._buffer.clear()
+
+    def append_post(self, agent_id: str, content: str, mood: Optional[str] = None, timestamp: Optional[Timestamp] = None) -> None:
         """
         Append a public post authored by an agent.
 
         :param agent_id: ID of the agent authoring the post.
         :param content: Content of the post.
         :param mood: Optional mood tag.
-        :param timestamp: Optional timestamp; defaults to current time if None.
-        """
-        if timestamp is None:
-            timestamp = datetime.utcnow()
-        entry = {
-            "agent_id": agent_id,
-            "content": content,
-            "type": "post",
-            "timestamp": timestamp,
-            "mood": mood,
-        }
-        self.entries.append(entry)
+        :param timestamp: Optional datetime or epoch seconds; defaults to current time if None.
+        """
+        self._append(FeedEntry(agent_id, content, "post", _to_epoch(timestamp), mood))
 
-    def append_event_log(self, agent_id: str, event: str, timestamp: Optional[datetime] = None) -> None:
+    def append_event_log(self, agent_id: str, event: str, timestamp: Optional[Timestamp] = None) -> None:
         """
         Append an event log entry authored by an agent.
 
         :param agent_id: ID of the agent authoring the event.
         :param event: Description of the event.
-        :param timestamp: Optional timestamp; defaults to current time if None.
-        """
-        if timestamp is None:
-            timestamp = datetime.utcnow()
-        entry = {
-            "agent_id": agent_id,
-            "content": event,
-            "type": "event_log",
-            "timestamp": timestamp,
-            "mood": None,
-        }
-        self.entries.append(entry)
+        :param timestamp: Optional datetime or epoch seconds; defaults to current time if None.
+        """
+        self._append(FeedEntry(agent_id, event, "event_log", _to_epoch(timestamp)))
 
-    def append_trade_reflection(self, agent_id: str, trade_summary: str, timestamp: Optional[datetime] = None) -> None:
+    def append_trade_reflection(self, agent_id: str, trade_summary: str, timestamp: Optional[Timestamp] = None) -> None:
         """
         Append a trade reflection authored by an agent.
 
         :param agent_id: ID of the agent authoring the reflection.
         :param trade_summary: Summary of the trade.
-        :param timestamp: Optional timestamp; defaults to current time if None.
-        """
-        if timestamp is None:
-            timestamp = datetime.utcnow()
-        entry = {
-            "agent_id": agent_id,
-            "content": trade_summary,
-            "type": "trade_reflection",
-            "timestamp": timestamp,
-            "mood": None,
-        }
-        self.entries.append(entry)
+        :param timestamp: Optional datetime or epoch seconds; defaults to current time if None.
+        """
+        self._append(FeedEntry(agent_id, trade_summary, "trade_reflection", _to_epoch(timestamp)))
+
+    def bulk_append(self, items: Iterable[Tuple[str, str, str, Optional[str]]], timestamp: Optional[Timestamp] = None) -> None:
+        """
+        Append several entries that share one timestamp, e.g. all posts from a simulation tick.
+        The clock is read once for the whole batch.
+
+        :param items: Iterable of (type, agent_id, content, mood) tuples, where type is
+                      "post", "event_log" or "trade_reflection"; mood is only kept for posts.
+        :param timestamp: Optional datetime or epoch seconds; defaults to current time if None.
+        :raises ValueError: If any item has an unknown type; nothing from the batch is appended.
+        """
+        timestamp = _to_epoch(timestamp)
+        # Validate the whole batch first so an invalid item appends nothing
+        items = list(items)
+        for entry_type, _, _, _ in items:
+            if entry_type not in self.ENTRY_TYPES:
+                raise ValueError(
+                    f"Invalid entry type '{entry_type}'. Valid types: {self.ENTRY_TYPES}")
+        for entry_type, agent_id, content, mood in items:
+            self._append(FeedEntry(agent_id, content, entry_type, timestamp,
+                                   mood if entry_type == "post" else None))
+
+    @staticmethod
+    def _newest(entries: List[FeedEntry], limit: int) -> Iterator[Dict]:
+        """
+        Iterate over the newest entries of a timestamp-ordered list as dicts, newest first.
+        Entries with equal timestamps come most recently appended first.
+        """
+        return (entry.to_dict() for entry in islice(reversed(entries), max(limit, 0)))
+
+    def iter_recent_entries(self, limit: int = 50) -> Iterator[Dict]:
+        """
+        Iterate over the most recent feed entries, newest first.
+        Only the selected entries are held in memory, not a sorted copy of the feed.
+
+        :param limit: Maximum number of entries to yield.
+        :return: Iterator of feed entries.
+        """
+        self.flush()
+        yield from self._newest(self.entries, limit)
+
+    def iter_entries_by_agent(self, agent_id: str, limit: int = 20) -> Iterator[Dict]:
+        """
+        Iterate over recent feed entries authored by a specific agent, newest first.
+
+        :param agent_id: Agent ID to filter entries.
+        :param limit: Maximum number of entries to yield.
+        :return: Iterator of feed entries.
+        """
+        self.flush()
+        yield from self._newest(self._by_agent.get(agent_id, []), limit)
 
     def get_recent_entries(self, limit: int = 50) -> List[Dict]:
         """
@@ -75,9 +221,7 @@ class SocialFeed:
         :param limit: Maximum number of entries to return.
         :return: List of feed entries.
         """
-        sorted_entries = sorted(
-            self.entries, key=lambda e: e["timestamp"], reverse=True)
-        return sorted_entries[:limit]
+        return list(self.iter_recent_entries(limit))
 
     def get_entries_by_agent(self, agent_id: str, limit: int = 20) -> List[Dict]:
         """
@@ -87,7 +231,4 @@ class SocialFeed:
         :param limit: Maximum number of entries to return.
         :return: List of feed entries.
         """
-        filtered = [e for e in self.entries if e["agent_id"] == agent_id]
-        sorted_entries = sorted(
-            filtered, key=lambda e: e["timestamp"], reverse=True)
-        return sorted_entries[:limit]
+        return list(self.iter_entries_by_agent(agent_id, limit))
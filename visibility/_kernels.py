@@ -0,0 +1,34 @@
+"""
+Numba-compiled kernels for bulk visibility checks.
+
+Importing this module requires NumPy and Numba and triggers JIT setup, so
+callers import it lazily on first use and fall back to the pure-Python path
+when the import fails.
+"""
+
+import numpy as np
+from numba import njit, prange
+
+
+@njit(parallel=True, cache=True)
+def eligibility_count(masks, bit):
+    """
+    Count, for each agent, how many other agents it has reciprocal visibility with.
+
+    Reciprocity holds exactly when both masks contain the bit, so every
+    sharing agent is eligible with all other sharers and non-sharers with
+    none. The sharers are counted in one parallel reduction instead of
+    comparing all pairs.
+
+    :return: int32 array with the count for each mask.
+    """
+    n = masks.shape[0]
+    sharers = 0
+    for i in prange(n):
+        if masks[i] & bit:
+            sharers += 1
+    out = np.zeros(n, dtype=np.int32)
+    for i in prange(n):
+        if masks[i] & bit:
+            out[i] = sharers - 1
+    return out
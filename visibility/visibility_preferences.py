@@ -1,14 +1,74 @@
 import logging
+import os
 from datetime import datetime
-from typing import Dict, Optional
+from collections.abc import Mapping
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Sequence
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
 
 # Configure logger for visibility preferences
 logger = logging.getLogger("visibility_preferences")
-logger.setLevel(logging.DEBUG)
-handler = logging.FileHandler("visibility_preferences.log")
-formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
-handler.setFormatter(formatter)
-logger.addHandler(handler)
+_log_configured = False
+
+
+def _ensure_log() -> None:
+    """
+    Attach the visibility_preferences.log file handler on first use rather than at import.
+    Set VISPREF_LOG=0 to skip the file handler entirely.
+    """
+    global _log_configured
+    if _log_configured:
+        return
+    if os.environ.get("VISPREF_LOG", "1") == "1":
+        handler = logging.FileHandler("visibility_preferences.log")
+        handler.setFormatter(logging.Formatter("%(asctime)s - %(levelname)s - %(message)s"))
+        logger.addHandler(handler)
+        # Let preference updates reach the file unless the application set a level;
+        # debug output stays off so can_view skips building its debug message
+        if logger.level == logging.NOTSET:
+            logger.setLevel(logging.INFO)
+    _log_configured = True
+
+
+@lru_cache(maxsize=None)
+def _eligibility_kernel():
+    """
+    Import the Numba eligibility kernel on first use; None if Numba is unavailable.
+    Deferred so that importing this module does not pull in Numba.
+    """
+    try:
+        from visibility._kernels import eligibility_count
+    except ImportError:
+        return None
+    return eligibility_count
+
+
+class _PreferencesView(Mapping):
+    """
+    Read-only, live category -> bool view over a VisibilityPreferences mask.
+    """
+
+    __slots__ = ("_owner",)
+
+    def __init__(self, owner: "VisibilityPreferences"):
+        self._owner = owner
+
+    def __getitem__(self, category: str) -> bool:
+        return bool(self._owner.mask & self._owner._CATEGORY_BITS[category])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._owner._CATEGORY_BITS)
+
+    def __len__(self) -> int:
+        return len(self._owner._CATEGORY_BITS)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self)!r})"
 
 
 class VisibilityPreferences:
@@ -26,11 +86,34 @@ class VisibilityPreferences:
         "show_trade_history",
     }
 
+    # One bit per category; preferences are stored as a single int mask
+    _CATEGORY_BITS: Dict[str, int] = {
+        cat: 1 << i for i, cat in enumerate(sorted(VALID_CATEGORIES))}
+
     def __init__(self, agent_id: str):
         self.agent_id = agent_id
-        # Store preferences as category -> bool
-        self.preferences: Dict[str, bool] = {
-            cat: False for cat in self.VALID_CATEGORIES}
+        # Bit set for each category the agent shares
+        self.mask: int = 0
+        self._view = _PreferencesView(self)
+
+    @property
+    def preferences(self) -> Mapping:
+        """
+        Read-only category -> bool view of the mask; use update_preference to change it.
+        Assigning to an item raises TypeError rather than silently dropping the write.
+        """
+        return self._view
+
+    @classmethod
+    def _category_bit(cls, category: str) -> int:
+        """
+        Return the mask bit for a category, validating it in the same lookup.
+        """
+        bit = cls._CATEGORY_BITS.get(category)
+        if bit is None:
+            raise ValueError(
+                f"Invalid category '{category}'. Valid categories: {cls.VALID_CATEGORIES}")
+        return bit
 
     def update_preference(self, category: str, value: bool) -> None:
         """
@@ -39,14 +122,13 @@ class VisibilityPreferences:
         :param category: The category to update.
         :param value: Boolean indicating whether to show or hide.
         """
-        if category not in self.VALID_CATEGORIES:
-            raise ValueError(
-                f"Invalid category '{category}'. Valid categories: {self.VALID_CATEGORIES}")
-
-        old_value = self.preferences.get(category, False)
-        self.preferences[category] = value
+        bit = self._category_bit(category)
+        old_value = bool(self.mask & bit)
+        self.mask = (self.mask | bit) if value else (self.mask & ~bit)
+        _ensure_log()
         logger.info(
-            f"Agent {self.agent_id} updated visibility preference '{category}' from {old_value} to {value}"
+            "Agent %s updated visibility preference '%s' from %s to %s",
+            self.agent_id, category, old_value, bool(value)
         )
 
     def can_view(self, viewer_prefs: "VisibilityPreferences", category: str) -> bool:
@@ -58,26 +140,119 @@ class VisibilityPreferences:
         :param category: The category to check.
         :return: True if viewer can view this agent's data in the category, False otherwise.
         """
-        if category not in self.VALID_CATEGORIES:
-            raise ValueError(
-                f"Invalid category '{category}'. Valid categories: {self.VALID_CATEGORIES}")
-
-        # Reciprocal logic: viewer can see if they share their own data in that category
-        viewer_shares = viewer_prefs.preferences.get(category, False)
-        this_agent_shares = self.preferences.get(category, False)
+        bit = self._category_bit(category)
 
         # Eligibility: viewer must share to view, and this agent must share to be viewed
-        eligible = viewer_shares and this_agent_shares
-        logger.debug(
-            f"Reciprocal check for category '{category}': viewer_shares={viewer_shares}, "
-            f"this_agent_shares={this_agent_shares}, eligible={eligible}"
-        )
+        eligible = bool(self.mask & viewer_prefs.mask & bit)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Reciprocal check for category '%s': viewer_shares=%s, "
+                "this_agent_shares=%s, eligible=%s",
+                category, bool(viewer_prefs.mask & bit), bool(self.mask & bit), eligible
+            )
         return eligible
 
+    def view_preferences(self) -> Mapping:
+        """
+        Get a read-only view of current visibility preferences.
+        The view reflects later updates and costs no allocation; use it for lookups.
+
+        :return: Mapping of category to boolean preference.
+        """
+        return self._view
+
     def get_preferences(self) -> Dict[str, bool]:
         """
         Get a copy of current visibility preferences.
+        Builds a new dict on every call; prefer view_preferences() when only reading.
 
         :return: Dictionary of category to boolean preference.
         """
-        return dict(self.preferences)
+        return dict(self._view)
+
+
+class VisibilityPreferencesRegistry:
+    """
+    Stores visibility masks for many agents in one compact byte array so that
+    pairwise reciprocal checks can be evaluated in bulk.
+    Uses the same category bits as VisibilityPreferences.
+    """
+
+    def __init__(self):
+        self._index: Dict[str, int] = {}
+        # One byte per agent; every category bit fits in a uint8
+        self._masks = bytearray()
+
+    def register(self, agent_id: str) -> int:
+        """
+        Register an agent with no categories shared, if not already registered.
+
+        :param agent_id: Agent ID to register.
+        :return: Internal index of the agent.
+        """
+        index = self._index.get(agent_id)
+        if index is None:
+            index = self._index[agent_id] = len(self._masks)
+            self._masks.append(0)
+        return index
+
+    def update_preference(self, agent_id: str, category: str, value: bool) -> None:
+        """
+        Update an agent's visibility preference for a given category.
+
+        :param agent_id: Agent whose preference changes; registered on first use.
+        :param category: The category to update.
+        :param value: Boolean indicating whether to show or hide.
+        """
+        bit = VisibilityPreferences._category_bit(category)
+        index = self.register(agent_id)
+        self._masks[index] = (self._masks[index] | bit) if value else (self._masks[index] & ~bit)
+
+    def can_view(self, viewer_id: str, target_id: str, category: str) -> bool:
+        """
+        Determine if a viewer can see a target's data in a category under reciprocal transparency.
+        Unregistered agents share nothing.
+        """
+        bit = VisibilityPreferences._category_bit(category)
+        return bool(self._mask(viewer_id) & self._mask(target_id) & bit)
+
+    def can_view_matrix(self, viewer_ids: Sequence[str], target_ids: Sequence[str], category: str) -> List[List[bool]]:
+        """
+        Evaluate reciprocal visibility for every viewer/target pair in one call.
+        Vectorized with NumPy when available.
+
+        :param viewer_ids: Viewing agent IDs (rows).
+        :param target_ids: Target agent IDs (columns).
+        :param category: The category to check.
+        :return: Matrix where [i][j] is True if viewer_ids[i] can view target_ids[j].
+        """
+        bit = VisibilityPreferences._category_bit(category)
+        viewer_masks = [self._mask(agent_id) & bit for agent_id in viewer_ids]
+        target_masks = [self._mask(agent_id) & bit for agent_id in target_ids]
+        if NUMPY_AVAILABLE:
+            viewers = np.array(viewer_masks, dtype=np.uint8)
+            targets = np.array(target_masks, dtype=np.uint8)
+            return ((viewers[:, None] & targets[None, :]) != 0).tolist()
+        return [[bool(viewer & target) for target in target_masks] for viewer in viewer_masks]
+
+    def reciprocal_counts(self, category: str) -> Dict[str, int]:
+        """
+        Count how many other registered agents each agent has reciprocal visibility with.
+        Uses the Numba kernel when available.
+
+        :param category: The category to check.
+        :return: Dictionary of agent ID to the number of other agents it can view.
+        """
+        bit = VisibilityPreferences._category_bit(category)
+        kernel = _eligibility_kernel()
+        if kernel is not None:
+            counts = kernel(np.frombuffer(self._masks, dtype=np.uint8), bit).tolist()
+        else:
+            sharing = [bool(mask & bit) for mask in self._masks]
+            sharers = sum(sharing)
+            counts = [sharers - 1 if shares else 0 for shares in sharing]
+        return dict(zip(self._index, counts))
+
+    def _mask(self, agent_id: str) -> int:
+        index = self._index.get(agent_id)
+        return 0 if index is None else self._masks[index]
@@ -6,11 +6,17 @@ Simulates a premium resource that requires micropayments.
 import json
 import uuid
 import time
+from collections import OrderedDict
 from typing import Dict, Any, Optional
 from fastapi import FastAPI, HTTPException, Request, Response
-from fastapi.responses import JSONResponse
 import logging
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 app = FastAPI(title="X402 Demo Server", version="1.0.0")
@@ -23,9 +29,85 @@ DEMO_CONFIG = {
     "premium_resource_cost": "0.10"  # 10 cents in USDC
 }
 
-# In-memory storage for demo
-payment_records = {}
-valid_signatures = set()
+# Demo signature acceptance: mock signatures by prefix, anything else by length
+_MOCK_SIGNATURE_PREFIX = "0xmocksig"
+_SIGNATURE_LENGTH_THRESHOLD = 60
+
+# The free-data payload never changes, so it is serialized once
+_FREE_DATA_BODY = json.dumps({
+    "data": {
+        "basic_info": [
+            "Current market status: Active",
+            "Basic price movements available",
+            "General market sentiment: Neutral"
+        ]
+    },
+    "status": "success",
+    "message": "Free tier data"
+}).encode()
+
+# 402 response body, serialized once around the two per-request fields
+# (paymentId and timestamp), keeping the original key order
+_PAYMENT_REQUIRED_PREFIX = (json.dumps({
+    "status": "payment_required",
+    "maxAmountRequired": DEMO_CONFIG["premium_resource_cost"],
+    "assetAddress": DEMO_CONFIG["usdc_address"],
+    "paymentAddress": DEMO_CONFIG["payment_address"],
+    "network": DEMO_CONFIG["network"],
+})[:-1] + ', "paymentId": "').encode()
+_PAYMENT_REQUIRED_MIDDLE = b'", "timestamp": '
+_PAYMENT_REQUIRED_SUFFIX = (
+    ', "message": ' + json.dumps("Payment required to access premium data") + "}").encode()
+
+
+def _payment_required_body(payment_id: str, timestamp: float) -> bytes:
+    """
+    Build the 402 response body from the preserialized template.
+    payment_id must be a UUID string, which needs no JSON escaping.
+    """
+    return (_PAYMENT_REQUIRED_PREFIX + payment_id.encode() + _PAYMENT_REQUIRED_MIDDLE
+            + repr(timestamp).encode() + _PAYMENT_REQUIRED_SUFFIX)
+
+
+def _json_loads(data: str) -> Any:
+    """
+    Parse JSON with orjson when available. orjson.JSONDecodeError subclasses
+    json.JSONDecodeError, so callers catch the same exception either way.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_response(content: Dict[str, Any]) -> Response:
+    """
+    Serialize a JSON response body directly, skipping JSONResponse's encoder pass.
+    """
+    if ORJSON_AVAILABLE:
+        body = orjson.dumps(content)
+    else:
+        body = json.dumps(content).encode()
+    return Response(content=body, media_type="application/json")
+
+
+# In-memory storage for demo, keyed by payment ID. Records are kept in
+# verification order and evicted from the front once expired or over capacity.
+PAYMENT_RECORD_TTL_SECONDS = 3600
+PAYMENT_RECORD_MAX_ENTRIES = 100_000
+payment_records: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+payments_processed = 0
+
+
+def _evict_payment_records(now: float) -> None:
+    """
+    Drop expired payment records, then the oldest ones while over capacity.
+    """
+    cutoff = now - PAYMENT_RECORD_TTL_SECONDS
+    while payment_records:
+        oldest = next(iter(payment_records.values()))
+        if oldest["verified_at"] > cutoff and len(payment_records) <= PAYMENT_RECORD_MAX_ENTRIES:
+            break
+        payment_records.popitem(last=False)
 
 
 def verify_payment_signature(payment_data: Dict[str, Any]) -> bool:
@@ -33,17 +115,23 @@ def verify_payment_signature(payment_data: Dict[str, Any]) -> bool:
     Mock payment verification.
     In production, this would verify the EIP-712 signature on-chain.
     """
+    global payments_processed
     signature = payment_data.get("signature", "")
     payment_id = payment_data.get("paymentId", "")
 
-    # For demo: accept mock signatures and store them
-    if signature.startswith("0xmocksig") or len(signature) > 60:
-        valid_signatures.add(signature)
+    # For demo: accept mock signatures and record the payment
+    # The length check is cheaper, so it runs before the prefix check
+    if len(signature) > _SIGNATURE_LENGTH_THRESHOLD or signature.startswith(_MOCK_SIGNATURE_PREFIX):
+        now = time.time()
         payment_records[payment_id] = {
             "signature": signature,
-            "verified_at": time.time(),
+            "verified_at": now,
             "status": "verified"
         }
+        # A re-verified payment moves to the back of the eviction order
+        payment_records.move_to_end(payment_id)
+        payments_processed += 1
+        _evict_payment_records(now)
         logger.info(
             f"✅ Payment verified: {payment_id} with signature {signature[:20]}...")
         return True
@@ -64,27 +152,16 @@ async def get_premium_data(request: Request):
         # Return 402 Payment Required with payment details
         payment_id = str(uuid.uuid4())
 
-        response_data = {
-            "status": "payment_required",
-            "maxAmountRequired": DEMO_CONFIG["premium_resource_cost"],
-            "assetAddress": DEMO_CONFIG["usdc_address"],
-            "paymentAddress": DEMO_CONFIG["payment_address"],
-            "network": DEMO_CONFIG["network"],
-            "paymentId": payment_id,
-            "timestamp": time.time(),
-            "message": "Payment required to access premium data"
-        }
-
         logger.info(f"💰 Returning 402 Payment Required: {payment_id}")
-        return JSONResponse(
+        return Response(
             status_code=402,
-            content=response_data,
-            headers={"Content-Type": "application/json"}
+            content=_payment_required_body(payment_id, time.time()),
+            media_type="application/json"
         )
 
     # Parse and verify payment
     try:
-        payment_data = json.loads(x_payment)
+        payment_data = _json_loads(x_payment)
 
         if verify_payment_signature(payment_data):
             # Payment verified - return premium data
@@ -116,7 +193,7 @@ async def get_premium_data(request: Request):
 
             logger.info(
                 f"✅ Premium data delivered for payment {payment_data.get('paymentId')}")
-            return JSONResponse(content=premium_data)
+            return _json_response(premium_data)
         else:
             raise HTTPException(
                 status_code=403, detail="Invalid payment signature")
@@ -135,17 +212,7 @@ async def get_free_data():
     """
     Free data endpoint for comparison.
     """
-    return {
-        "data": {
-            "basic_info": [
-                "Current market status: Active",
-                "Basic price movements available",
-                "General market sentiment: Neutral"
-            ]
-        },
-        "status": "success",
-        "message": "Free tier data"
-    }
+    return Response(content=_FREE_DATA_BODY, media_type="application/json")
 
 
 @app.get("/api/payment-status/{payment_id}")
@@ -153,6 +220,7 @@ async def get_payment_status(payment_id: str):
     """
     Check payment status.
     """
+    _evict_payment_records(time.time())
     if payment_id in payment_records:
         return {
             "payment_id": payment_id,
@@ -170,7 +238,8 @@ async def health_check():
         "status": "healthy",
         "service": "x402-demo-server",
         "timestamp": time.time(),
-        "payments_processed": len(payment_records)
+        "payments_processed": payments_processed,
+        "payments_active": len(payment_records)
     }
 
 if __name__ == "__main__":